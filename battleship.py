@@ -2,29 +2,39 @@
 # -*- coding: utf-8 -*-
 
 import sys
+import argparse
 import pygame
 from pygame.locals import *
 from packages.public.constants import Constants
 from packages.public.communication import Communication
 from packages.player import Player
+from packages.player.scenes import Scenes
+from packages.player.scenes.scene import Scene
 from packages.player.window import Window
-from packages.player.commands import Commands
+from packages.core.commands import Commands
 from packages.player.grid import Grid
 from packages.player.table import Table
-from packages.player.boat import Boat
 from packages.public.logger import Logger
 
 
 class Battleship(Communication):
 
-    def __init__(self, offline=False):
+    def __init__(self, offline=False, profile=None, decoupled=False):
         """
         Constructor. Extends the Communication class.
         Connects the player with server.
         Parameter offline is set to True for gui testings only.
+        Profile is the file where frame times are written
+        on exit (.csv or .json), None for no file.
+        If decoupled, messages are handled on the trace thread and
+        input on each loop, while the screen is drawn at Constants.FPS.
         :param offline: bool
+        :param profile: str
+        :param decoupled: bool
         """
         super().__init__()
+        self._profile = profile
+        self._decoupled = decoupled
         self._init_surf_areas()
         self._window = Window(caption=Constants.GAME_CAPTION, width=Constants.WIN_WIDTH,
                               height=Constants.WIN_HEIGHT, margin=Constants.WIN_MARGIN)
@@ -44,6 +54,11 @@ class Battleship(Communication):
         else:
             self._player.connected = self.connect_to_server(ip_address=Constants.SERVER_HOSTNAME)
         self._commands = Commands(player=self._player)
+        self._commands.on_receive = Window.notify_inbox  # wakes the idle window
+        self._commands.dispatch = decoupled
+        if self._player.connected:
+            self._commands.codec()  # asks the server for the preferred codec
+        self._scenes = Scenes(battleship=self)
 
     def _init_surf_areas(self):
         """
@@ -123,101 +138,78 @@ class Battleship(Communication):
         """
         return self._fleet_table
 
-    def lobby_loop(self):
+    @property
+    def scenes(self):
+        """
+        Getter.
+        :return: <class Scenes>
+        """
+        return self._scenes
+
+    def main_loop(self):
         """
-        Main lobby loop.
+        Main loop, the only one in the game.
+        Starts in the lobby, scenes change as the game goes on.
         :return: None
         """
         if self._player.connected:
             self._commands.trace()  # starts the new thread
-        self._window.show_welcome_screen()
-        self._window.freeze(time=Constants.WELCOME_SCREEN_SLEEP_TIME, func=self.check_for_quit)
-
-        if not self._player.connected:  # Connecting with the server failed!
-            self._window.clear()
-            self._window.show_connection_failed_screen()
-            self._window.freeze(time=Constants.CONNECTION_FAILED_SLEEP_TIME, func=self.check_for_quit)
-            self._terminate()   # closes the game automatically
-
-        self._window.show_waiting_for_player_screen()
-        while self._player.connected:
-            # check server communication
-            self._commands.check()
-
-            # handle the game events
-            self.check_for_quit()
-
-            # update the game stats
-            if self._player.in_game:    # command check received "-game;" message from the server
-                self.game_loop()  # here the game loop starts
-                self._window.clear()
-                self._window.show_game_over_screen(win=self._player.won)
-
-            # update the screen
-            self._window.update()
-
-    def game_loop(self):
-        """
-        Main game loop.
+        self._scenes.switch(Scene.LOBBY)
+        while True:
+            self.frame()
+
+    def frame(self):
+        """
+        One loop of the game.
+        Events are read once, quit and profiler keys are handled here,
+        the rest is handled by the current scene.
+        Decoupled game draws only when the frame is due, otherwise
+        it goes straight to the next input, so a click is handled
+        (and a shot sent) without waiting for the drawing.
         :return: None
         """
-        # self._window.show_game_screen(self._player_grid, self._opponent_grid, self._fleet_table)
-        self._player.create_fleet()
-        while self._player.in_game:
-            # start of the game!
-            # refresh the screen (that is, clear) so we can see changes
-            self._window.clear()
-            self._window.show_game_screen(self._player)  # redraw
+        events = self._window.get_events()
+        self.check_for_quit(events)
 
+        with self._commands.lock:   # decoupled trace thread handles messages at the same time
             # check server communication
+            Window.PROFILER.begin("commands")
             self._commands.check()
+            Window.PROFILER.end("commands")
 
-            # handle the game events
-            self.check_for_quit()
-
-            # update the game stats
-            if self._player.attack:
-                self._player.strike()
+            # handle the game events, update the game stats
+            self._scenes.update(events)
 
-            # update the screen
+        # update the screen
+        if not self._decoupled:
+            self._scenes.draw()
             self._window.update()
-        self._window.show_game_screen(self._player)
-        self._window.show_game_over_screen_alpha(win=self._player.won)
-        self._window.freeze(time=5, func=self.check_for_quit)
+        else:
+            if self._window.frame_due:
+                self._scenes.draw()
+                self._window.update(wait=False)
+            self._window.wait_input()
         return
 
-    @staticmethod
-    def check_mouse_events():
-        """
-        Checks mouse events.
-        Returns mousex, mousey, clicked.
-        :return: tuple
-        """
-        clicked = False
-        mousex, mousey = (0, 0)     # if no movement had happend
-        for event in pygame.event.get(MOUSEMOTION):
-            mousex, mousey = event.pos
-        for event in pygame.event.get(MOUSEBUTTONUP):
-            mousex, mousey = event.pos
-            clicked = True
-        # Logger.print(message=f"Mouse: ({mousex}, {mousey}, {clicked})", type_=Logger.INFO)
-        return mousex, mousey, clicked
-
-    def check_for_quit(self):
+    def check_for_quit(self, events):
         """
         Checks if user wants to close the game.
         Game can be closed either by mouse click on X
         or pressing the ESCAPE key.
+        F3 shows or hides the profiler.
+        :param events: list
         :return: None
         """
-        for _ in pygame.event.get(QUIT):    # mouse press
-            self._terminate()
-        for event in pygame.event.get(KEYUP):
-            if event.key == K_ESCAPE:   # ESCAPE keyup
-                self._terminate()
-            pygame.event.post(event)
+        for event in events:
+            if event.type == QUIT:  # mouse press
+                self.terminate()
+            elif event.type == KEYUP and event.key == K_ESCAPE:     # ESCAPE keyup
+                self.terminate()
+            elif event.type == KEYUP and event.key == K_F3:     # F3 keyup
+                self._window.toggle_profiler()
+        return
 
-    def _terminate(self):
+    def terminate(self):
         """
         Terminates the game.
         :return: None
@@ -230,14 +222,22 @@ class Battleship(Communication):
             self._player.connected = False  # ends game loop
             self._commands.join()           # ensures program do not finish before trace thread is ended
 
+        if self._profile is not None:
+            Window.PROFILER.dump(self._profile)
+            Logger.print(message=f"Frame times written to {self._profile}", type_=Logger.INFO)
         Logger.print(message="Terminated!", type_=Logger.INFO)
         pygame.quit()
         sys.exit()
 
 
 def main():
-    battleship = Battleship()
-    battleship.lobby_loop()
+    parser = argparse.ArgumentParser(description="Battleship client.")
+    parser.add_argument("--profile", default=None, help="write frame times to this file on exit, .csv or .json")
+    parser.add_argument("--decoupled", action="store_true",
+                        help="handle input and messages as they come, draw only at the frame rate")
+    args = parser.parse_args()
+    battleship = Battleship(profile=args.profile, decoupled=args.decoupled)
+    battleship.main_loop()
 
 
 if __name__ == "__main__":
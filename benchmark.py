@@ -0,0 +1,673 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+import socket
+import struct
+import asyncio
+import timeit
+import random
+import tracemalloc
+import argparse
+import subprocess
+
+from packages.core.board import Board
+from packages.public.bitboard import Bitboard
+from packages.public.codec import Codec
+from packages.public.communication import Communication
+from packages.public.constants import Constants
+from packages.public.framing import Framing
+from packages.public.limits import Limits
+from packages.public.logger import Logger
+from packages.public.stats import Stats
+from packages.server.clients.client import Client
+from packages.server.fleet import Fleet
+from packages.server.games import Games
+from packages.server.games.game import Game
+from packages.structures.queue import Queue, RingBuffer, SafeQueue, SafeRingBuffer
+
+
+def _start_server(mode, ip_address):
+    """
+    Starts server.py in a new process and waits until
+    it accepts connections.
+    :param mode: str
+    :param ip_address: str
+    :return: <class Popen>
+    """
+    server = subprocess.Popen([sys.executable, "server.py", ip_address, "--mode", mode],
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, preexec_fn=Limits.raise_open_files)
+    while True:
+        try:
+            socket.create_connection((ip_address, Communication._port), timeout=1).close()
+        except OSError:
+            if server.poll() is not None:
+                raise RuntimeError(f"Server ({mode}) has failed to start.")
+            time.sleep(0.1)
+        else:
+            time.sleep(0.5)     # server drops the probe client before benchmark starts
+            return server
+
+
+def _process_stats(pid):
+    """
+    Returns resident memory (kB), number of threads and
+    consumed cpu time (seconds) of the given process.
+    Reads linux /proc file system.
+    :param pid: int
+    :return: tuple :: (int, int, float)
+    """
+    rss, threads = 0, 0
+    with open(f"/proc/{pid}/status") as file:
+        for line in file:
+            if line.startswith("VmRSS:"):
+                rss = int(line.split()[1])
+            elif line.startswith("Threads:"):
+                threads = int(line.split()[1])
+    with open(f"/proc/{pid}/stat") as file:
+        fields = file.read().rsplit(')', 1)[1].split()
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")   # utime + stime
+    return rss, threads, cpu
+
+
+async def _open_connections(ip_address, n, concurrency):
+    """
+    Opens n idle connections to the server.
+    Returns list of opened stream writers.
+    :param ip_address: str
+    :param n: int
+    :param concurrency: int
+    :return: list
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    writers = []
+
+    async def connect():
+        async with semaphore:
+            try:
+                _, writer = await asyncio.open_connection(ip_address, Communication._port)
+            except OSError:
+                return
+            writers.append(writer)
+
+    await asyncio.gather(*(connect() for _ in range(n)))
+    return writers
+
+
+async def _idle_connections(mode, ip_address, n, concurrency, idle_time):
+    """
+    Benchmark for one server mode.
+    Returns dictionary with measured values.
+    :param mode: str
+    :param ip_address: str
+    :param n: int
+    :param concurrency: int
+    :param idle_time: float
+    :return: dict
+    """
+    server = _start_server(mode=mode, ip_address=ip_address)
+    base_rss, base_threads, _ = _process_stats(server.pid)
+    start = time.perf_counter()
+    writers = await _open_connections(ip_address=ip_address, n=n, concurrency=concurrency)
+    elapsed = time.perf_counter() - start
+
+    await asyncio.sleep(1)  # let the server settle down
+    _, _, cpu_start = _process_stats(server.pid)
+    await asyncio.sleep(idle_time)
+    rss, threads, cpu_end = _process_stats(server.pid)
+    alive = server.poll() is None
+
+    for writer in writers:  # clients close first, so the server port does not stay in TIME_WAIT
+        writer.close()
+    await asyncio.sleep(1)
+    server.kill()
+    server.wait()
+    return {
+        "mode": mode,
+        "connected": len(writers),
+        "connections/s": len(writers) / elapsed,
+        "rss MB": rss / 1024,
+        "kB/connection": (rss - base_rss) / max(len(writers), 1),
+        "threads": threads - base_threads,
+        "idle cpu %": 100 * (cpu_end - cpu_start) / idle_time,
+        "alive": alive,
+    }
+
+
+def connections(args):
+    """
+    Compares threaded and asyncio server with
+    thousands of idle connections.
+    :param args: <class Namespace>
+    :return: None
+    """
+    Limits.raise_open_files()
+    for mode in args.modes:
+        result = asyncio.run(_idle_connections(mode=mode, ip_address=args.ip_address, n=args.n,
+                                               concurrency=args.concurrency, idle_time=args.idle_time))
+        print(", ".join(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}"
+                        for key, value in result.items()))
+    return
+
+
+async def _vanishing_client(ip_address, semaphore, rng, counts):
+    """
+    Client connects and waits for the game, sometimes sends his fleet too,
+    then vanishes: connection is reset, without "-left;".
+    Counts clients that were told that their opponent has left.
+    :param ip_address: str
+    :param semaphore: <class Semaphore>
+    :param rng: <class Random>
+    :param counts: dict
+    :return: None
+    """
+    async with semaphore:
+        try:
+            reader, writer = await asyncio.open_connection(ip_address, Communication._port)
+        except OSError:
+            counts["failed"] += 1
+            return
+    received = b""
+    try:
+        received = await asyncio.wait_for(reader.read(Communication._buffer), timeout=rng.uniform(0, 1))
+        if b"-game" in received and rng.random() < 0.5:    # game goes on, both fleets are needed to start
+            board = Board()
+            board.place_random(rng=rng)
+            message = f"{Constants.CMD_READY};fleet|{Bitboard.encode(board.masks())}"
+            writer.write(Framing.encode(Codec.encode(message, Codec.TEXT)))
+        received += await asyncio.wait_for(reader.read(Communication._buffer), timeout=rng.uniform(0, 0.5))
+    except (asyncio.TimeoutError, OSError):
+        pass
+    counts["games"] += b"-game" in received
+    counts["released"] += b"-left" in received
+    writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+    writer.close()
+    return
+
+
+async def _churn(mode, ip_address, n, rounds, concurrency):
+    """
+    Soak test for one server mode. In each round, n clients connect,
+    get paired into games and vanish. After each round, server
+    should be back where it started: memory, threads and open files
+    are flat, and server does not use cpu while nobody is connected.
+    Prints one line for each round.
+    :param mode: str
+    :param ip_address: str
+    :param n: int
+    :param rounds: int
+    :param concurrency: int
+    :return: None
+    """
+    server = _start_server(mode=mode, ip_address=ip_address)
+    rng = random.Random(0)
+    semaphore = asyncio.Semaphore(concurrency)
+    try:
+        rss, threads, _ = _process_stats(server.pid)
+        print(f"mode: {mode}, before: rss MB: {rss / 1024:.1f}, threads: {threads}, "
+              f"open files: {len(os.listdir(f'/proc/{server.pid}/fd'))}")
+        for round_ in range(1, rounds + 1):
+            counts = {"failed": 0, "games": 0, "released": 0}
+            _, _, cpu_start = _process_stats(server.pid)
+            start = time.perf_counter()
+            await asyncio.gather(*(_vanishing_client(ip_address=ip_address, semaphore=semaphore, rng=rng,
+                                                     counts=counts) for _ in range(n)))
+            elapsed = time.perf_counter() - start
+            await asyncio.sleep(1)  # let the server tear down the last clients
+            _, _, cpu_idle_start = _process_stats(server.pid)
+            await asyncio.sleep(1)
+            rss, threads, cpu_end = _process_stats(server.pid)
+            print(f"round: {round_}, clients/s: {n / elapsed:.0f}, in game: {counts['games']}, "
+                  f"released: {counts['released']}, failed: {counts['failed']}, "
+                  f"rss MB: {rss / 1024:.1f}, threads: {threads}, open files: {len(os.listdir(f'/proc/{server.pid}/fd'))}, "
+                  f"cpu s: {cpu_end - cpu_start:.2f}, idle cpu %: {100 * (cpu_end - cpu_idle_start):.1f}, "
+                  f"alive: {server.poll() is None}")
+    finally:
+        server.kill()
+        server.wait()
+    return
+
+
+def churn(args):
+    """
+    Soak test: thousands of clients connect and vanish
+    without "-left;", server must not keep anything of them.
+    :param args: <class Namespace>
+    :return: None
+    """
+    Limits.raise_open_files()
+    for mode in args.modes:
+        asyncio.run(_churn(mode=mode, ip_address=args.ip_address, n=args.n, rounds=args.rounds,
+                           concurrency=args.concurrency))
+    return
+
+
+def _receive(player):
+    """
+    Receives the next message, skipping (and applying)
+    the answer to the codec request.
+    :param player: <class Communication>
+    :return: tuple :: (str, str)
+    """
+    while True:
+        cmd_key, value = Communication.receive(connection=player)
+        if cmd_key != Constants.CMD_CODEC:
+            return cmd_key, value
+        Communication.set_codec(connection=player, version=int(value))
+
+
+def _turns(mode, ip_address, n, codec):
+    """
+    Two clients play n turns against the server.
+    Returns stats of turn round-trip times (seconds), that is,
+    time from attacker's "-strike;i|j" to the received result.
+    Attackers only strike at the sea, so the game does not end.
+    :param mode: str
+    :param ip_address: str
+    :param n: int
+    :param codec: int
+    :return: <class Stats>
+    """
+    server = _start_server(mode=mode, ip_address=ip_address)
+    players = [Communication(), Communication()]
+    boards = {}
+    try:
+        for k, player in enumerate(players):
+            player.connect_to_server(ip_address=ip_address)
+            Communication.send_(connection=player, message=f"{Constants.CMD_CODEC};{codec}")
+            boards[player] = Board()
+            boards[player].place_random(rng=random.Random(k))
+        for player in players:
+            assert _receive(player)[0] == Constants.CMD_GAME
+        for player in players:
+            Communication.send_(connection=player,
+                                message=f"{Constants.CMD_READY};fleet|{Bitboard.encode(boards[player].masks())}")
+        sea = {player: [(i, j) for i in range(Constants.GRID_SIZE) for j in range(Constants.GRID_SIZE)
+                        if boards[player].type_at(i, j) == Constants.EMPTY] for player in players}
+        if n > sum(map(len, sea.values())):
+            raise ValueError(f"At most {sum(map(len, sea.values()))} turns can be played without hitting the fleet.")
+
+        samples = Stats()
+        received = players[0]   # first attacker is chosen by the server
+        if _receive(received)[0] == Constants.CMD_STRIKE:
+            attacker, defender = players
+        else:
+            defender, attacker = players
+        for _ in range(n):
+            i, j = sea[defender].pop()
+            if attacker is not received:
+                assert _receive(attacker)[0] == Constants.CMD_STRIKE
+            if defender is not received:
+                assert _receive(defender)[0] == Constants.CMD_DEFEND
+            received = None
+            start = time.perf_counter()
+            Communication.send_(connection=attacker, message=f"{Constants.CMD_STRIKE};{i}|{j}")
+            _receive(attacker)
+            samples.add(time.perf_counter() - start)
+            assert _receive(defender) == (Constants.CMD_STRIKE, f"{i}|{j}")
+            attacker, defender = defender, attacker
+    finally:
+        for player in players:
+            player.close()
+        time.sleep(1)
+        server.kill()
+        server.wait()
+    return samples
+
+
+def turns(args):
+    """
+    Measures turn round-trip time on the server.
+    :param args: <class Namespace>
+    :return: None
+    """
+    Logger._logger = False
+    for mode in args.modes:
+        samples = _turns(mode=mode, ip_address=args.ip_address, n=args.n, codec=args.codec)
+        print(f"mode: {mode}, codec: {args.codec}, turns: {samples.count}, mean ms: {1e3 * samples.mean():.3f}, "
+              + ", ".join(f"p{p} ms: {1e3 * value:.3f}" for p, value in samples.percentiles().items()))
+    return
+
+
+def codec(args):
+    """
+    Micro-benchmark of the text protocol (current string path)
+    and the binary codec, for the most frequent messages
+    and the messages with a text field.
+    Relay is what server does with a strike: decode it, and encode
+    it again for the opponent.
+    Each time is the best of repeat runs, so the first runs
+    (cold caches, CPU frequency) do not skew the results.
+    :param args: <class Namespace>
+    :return: None
+    """
+    board = Board()
+    board.place_random(rng=random.Random(0))
+    messages = (
+        f"{Constants.CMD_STRIKE};",
+        f"{Constants.CMD_STRIKE};3|7",
+        f"{Constants.CMD_STRIKE};{Constants.EMPTY}",
+        f"{Constants.CMD_DEFEND};",
+        f"{Constants.CMD_GAME};username",
+        f"{Constants.CMD_READY};fleet|{Bitboard.encode(board.masks())}",
+    )
+    for message in messages:
+        print(f"{message[:14]:<14}", end=' ')
+        for version in Codec.VERSIONS:
+            payload = Codec.encode(message, version)
+            results = {
+                "encode": min(timeit.repeat(lambda: Codec.encode(message, version),
+                                            repeat=args.repeat, number=args.n)),
+                "decode": min(timeit.repeat(lambda: Codec.decode(payload), repeat=args.repeat, number=args.n)),
+                "relay": min(timeit.repeat(lambda: Codec.encode(';'.join(Codec.decode(payload)), version),
+                                           repeat=args.repeat, number=args.n)),
+            }
+            print(f"| {('text', 'binary')[version]} bytes: {len(payload):>2}, "
+                  + ", ".join(f"{key} ns: {1e9 * value / args.n:>4.0f}" for key, value in results.items()),
+                  end=' ')
+        print()
+    return
+
+
+def _create_games(registry, clients):
+    """
+    Creates a game for each pair of clients and adds it to the registry.
+    :param registry: <class Games>
+    :param clients: list
+    :return: list
+    """
+    games_ = []
+    for i in range(0, len(clients), 2):
+        game_ = Game(server=None, client1=clients[i], client2=clients[i + 1], game_id=i // 2)
+        registry.add_game(game_)
+        games_.append(game_)
+    return games_
+
+
+def games(args):
+    """
+    Games registry with n concurrent games.
+    Measures create, lookup and end throughput and memory per game.
+    :param args: <class Namespace>
+    :return: None
+    """
+    Logger._logger = False
+    clients = [Client(connection=None, username=str(i)) for i in range(2 * args.n)]
+
+    registry = Games(limit=None)
+    start = time.perf_counter()
+    games_ = _create_games(registry=registry, clients=clients)
+    create = time.perf_counter() - start
+    start = time.perf_counter()
+    for game_ in games_:
+        registry.get_game(game_.id)
+    lookup = time.perf_counter() - start
+    start = time.perf_counter()
+    for game_ in games_:
+        registry.end_game(game_)
+    end = time.perf_counter() - start
+    del games_
+
+    registry = Games(limit=None)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    games_ = _create_games(registry=registry, clients=clients)
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    print(f"games: {len(games_)}, created: {registry.created}, "
+          f"create/s: {args.n / create:.0f}, lookup/s: {args.n / lookup:.0f}, end/s: {args.n / end:.0f}, "
+          f"bytes/game: {memory / args.n:.0f}")
+    return
+
+
+def _play_board(board, rng):
+    """
+    Strikes every cell of the board in random order
+    until the fleet is defeated.
+    :param board: <class Board>
+    :param rng: <class Random>
+    :return: int
+    """
+    cells = [(i, j) for i in range(board.size) for j in range(board.size)]
+    rng.shuffle(cells)
+    strikes = 0
+    for i, j in cells:
+        board.strike(i, j)
+        strikes += 1
+        if board.is_defeated():
+            break
+    return strikes
+
+
+def boards(args):
+    """
+    Board throughput: random fleet placement, server side fleet
+    validation (decode of the "-ready;fleet|..." value) and
+    whole games played on a single board.
+    :param args: <class Namespace>
+    :return: None
+    """
+    rng = random.Random(0)
+    fleets = []
+    start = time.perf_counter()
+    for _ in range(args.n):
+        board = Board()
+        board.place_random(rng)
+        fleets.append(Bitboard.encode(board.masks()))
+    place = time.perf_counter() - start
+
+    start = time.perf_counter()
+    valid = sum(Fleet.decode(text) is not None for text in fleets)
+    validate = time.perf_counter() - start
+
+    start = time.perf_counter()
+    strikes = sum(_play_board(board=Fleet.decode(text), rng=rng) for text in fleets)
+    play = time.perf_counter() - start
+
+    print(f"boards: {args.n}, valid: {valid}, mean strikes/game: {strikes / args.n:.1f}")
+    for name, elapsed in (("place", place), ("validate", validate), ("play", play)):
+        print(f"{name:<9} boards/min: {60 * args.n / elapsed:>12.0f}, us/board: {1e6 * elapsed / args.n:>8.2f}")
+    return
+
+
+def _time_frames(n, draw):
+    """
+    Returns the mean time of n frames, in milliseconds.
+    :param n: int
+    :param draw: function
+    :return: float
+    """
+    start = time.perf_counter()
+    for k in range(n):
+        draw(k)
+    return 1e3 * (time.perf_counter() - start) / n
+
+
+def frames(args):
+    """
+    Frame time of the game screen, without the FPS clock.
+    Compares drawing the background as before (title, grid names
+    and grids every frame) with blitting the cached one, and the whole
+    screen with the retained one, where nothing or only the hovered box changed.
+    Runs with the dummy video driver unless SDL_VIDEODRIVER is set.
+    :param args: <class Namespace>
+    :return: None
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame   # only this benchmark needs pygame and the window
+    from battleship import Battleship
+
+    Logger._logger = False
+    battleship = Battleship(offline=True)
+    window, player = battleship.window, battleship.player
+    rng = random.Random(0)
+    player.board.place_random(rng)
+    for _ in range(30):
+        player.check_strike(rng.randrange(Constants.GRID_SIZE), rng.randrange(Constants.GRID_SIZE))
+
+    def drawn(_):
+        window._draw_background(surface=window.DISPLAYSURF, player=player)
+
+    def cached(_):
+        window.DISPLAYSURF.blit(window._get_background(player=player), (0, 0))
+
+    def full(_):
+        window.clear()
+        window.show_game_screen(player=player)
+        pygame.display.update()
+
+    def retained(k, hover=False):
+        if hover:
+            window.highlight(boxes=[player.opponent_grid[k % Constants.GRID_SIZE][k // Constants.GRID_SIZE % Constants.GRID_SIZE]],
+                             color=Constants.RED)
+        window.show_game_screen(player=player)
+        if window._dirty:
+            pygame.display.update(window._dirty)
+        window._dirty = []
+
+    results = (
+        ("background drawn (before)", _time_frames(n=args.n, draw=drawn)),
+        ("background cached", _time_frames(n=args.n, draw=cached)),
+        ("whole screen", _time_frames(n=args.n, draw=full)),
+        ("retained, idle", _time_frames(n=args.n, draw=retained)),
+        ("retained, hover", _time_frames(n=args.n, draw=lambda k: retained(k, hover=True))),
+    )
+    for name, elapsed in results:
+        print(f"{name:<27} ms/frame: {elapsed:>7.3f}")
+    print(f"text cache hits: {window.TEXT_CACHE.hits}, misses: {window.TEXT_CACHE.misses}")
+    return
+
+
+class _ListQueue(list):
+    """
+    Queue as it was before, list with pop(0) dequeue.
+    Kept here only as the baseline for the queues benchmark.
+    """
+
+    def enqueue(self, value):
+        """
+        Adds new element in queue.
+        :param value: <class object>
+        :return: None
+        """
+        self.append(value)
+
+    def dequeue(self):
+        """
+        Removes the first element, O(n).
+        :return: <class object>
+        """
+        if len(self) > 0:
+            return self.pop(0)
+        return None
+
+
+def _fill_drain(queue_, n, batch):
+    """
+    Enqueues n elements and dequeues all of them,
+    one by one, or in batches of given size if batch is set.
+    :param queue_: queue with enqueue and dequeue methods
+    :param n: int
+    :param batch: int or None
+    :return: float
+    """
+    start = time.perf_counter()
+    for i in range(n):
+        queue_.enqueue(i)
+    if batch:
+        while queue_.dequeue_many(batch):
+            pass
+    else:
+        for _ in range(n):
+            queue_.dequeue()
+    return time.perf_counter() - start
+
+
+def queues(args):
+    """
+    Micro-benchmark of the queue family, fill with n elements and drain.
+    The old list based queue is O(n) per dequeue,
+    so it is skipped for n above --baseline-limit.
+    :param args: <class Namespace>
+    :return: None
+    """
+    for exponent in range(3, args.max_exponent + 1):
+        n = 10 ** exponent
+        candidates = {
+            "Queue": lambda: Queue(),
+            "RingBuffer": lambda: RingBuffer(capacity=n),
+            "SafeQueue": lambda: SafeQueue(),
+            "SafeRingBuffer": lambda: SafeRingBuffer(capacity=n),
+        }
+        if n <= args.baseline_limit:
+            candidates["list (old)"] = lambda: _ListQueue()
+        for name, factory in candidates.items():
+            elapsed = _fill_drain(queue_=factory(), n=n, batch=None)
+            line = f"n: {n:>8}, {name:<14} ns/op: {1e9 * elapsed / (2 * n):>8.0f}"
+            if name != "list (old)":
+                batched = _fill_drain(queue_=factory(), n=n, batch=args.batch)
+                line += f", batch {args.batch} ns/op: {1e9 * batched / (2 * n):>6.0f}"
+            print(line)
+    return
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Battleship benchmarks.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    parser_connections = subparsers.add_parser("connections", help="idle connections, threaded vs asyncio server")
+    parser_connections.add_argument("-n", type=int, default=10000)
+    parser_connections.add_argument("--ip-address", default="127.0.0.1")
+    parser_connections.add_argument("--modes", nargs="+", default=["async", "threaded"])
+    parser_connections.add_argument("--concurrency", type=int, default=500)
+    parser_connections.add_argument("--idle-time", type=float, default=5)
+    parser_connections.set_defaults(func=connections)
+
+    parser_churn = subparsers.add_parser("churn", help="soak test, clients connect and vanish without leaving")
+    parser_churn.add_argument("-n", type=int, default=2000, help="clients in each round")
+    parser_churn.add_argument("--rounds", type=int, default=10)
+    parser_churn.add_argument("--ip-address", default="127.0.0.1")
+    parser_churn.add_argument("--modes", nargs="+", default=["async", "threaded"])
+    parser_churn.add_argument("--concurrency", type=int, default=500)
+    parser_churn.set_defaults(func=churn)
+
+    parser_turns = subparsers.add_parser("turns", help="turn round-trip time")
+    parser_turns.add_argument("-n", type=int, default=150)
+    parser_turns.add_argument("--ip-address", default="127.0.0.1")
+    parser_turns.add_argument("--modes", nargs="+", default=["async", "threaded"])
+    parser_turns.add_argument("--codec", type=int, choices=Codec.VERSIONS, default=Constants.CODEC_VERSION)
+    parser_turns.set_defaults(func=turns)
+
+    parser_codec = subparsers.add_parser("codec", help="encode/decode, text vs binary codec")
+    parser_codec.add_argument("-n", type=int, default=100000)
+    parser_codec.add_argument("--repeat", type=int, default=5)
+    parser_codec.set_defaults(func=codec)
+
+    parser_games = subparsers.add_parser("games", help="games registry, create/end throughput and memory")
+    parser_games.add_argument("-n", type=int, default=10000)
+    parser_games.set_defaults(func=games)
+
+    parser_boards = subparsers.add_parser("boards", help="bitboard placement, validation and games per minute")
+    parser_boards.add_argument("-n", type=int, default=100000)
+    parser_boards.set_defaults(func=boards)
+
+    parser_frames = subparsers.add_parser("frames", help="game screen frame time, cached background and dirty rectangles")
+    parser_frames.add_argument("-n", type=int, default=500)
+    parser_frames.set_defaults(func=frames)
+
+    parser_queues = subparsers.add_parser("queues", help="queue family vs old list queue, fill and drain")
+    parser_queues.add_argument("--max-exponent", type=int, default=6)
+    parser_queues.add_argument("--baseline-limit", type=int, default=10 ** 5)
+    parser_queues.add_argument("--batch", type=int, default=64)
+    parser_queues.set_defaults(func=queues)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+import random
+import asyncio
+import argparse
+import collections
+
+from packages.core.commands import Commands
+from packages.core.player_core import PlayerCore
+from packages.public.codec import Codec
+from packages.public.communication import Communication
+from packages.public.constants import Constants
+from packages.public.framing import Framing
+from packages.public.limits import Limits
+from packages.public.logger import Logger
+from packages.public.stats import Stats
+
+
+class Report(object):
+
+    def __init__(self):
+        """
+        Constructor.
+        Counters and stats shared by all bots.
+        """
+        self._start = time.perf_counter()
+        self.connected = 0
+        self.last_connected = self._start
+        self.games = 0      # counted once per game, by the winner
+        self.turns = Stats(size=100000)  # seconds from "-strike;i|j" to the result
+        self.quits = 0  # games the bot quit in the middle, with quit probability
+        self.left = 0   # games ended by the opponent quitting
+        self.errors = collections.Counter()
+
+    @property
+    def elapsed(self):
+        """
+        Getter. Returns seconds since the start.
+        :return: float
+        """
+        return time.perf_counter() - self._start
+
+    def connection(self):
+        """
+        Counts the new connection.
+        :return: None
+        """
+        self.connected += 1
+        self.last_connected = time.perf_counter()
+        return
+
+    def __str__(self):
+        """
+        To string method.
+        :return: str
+        """
+        connecting = max(self.last_connected - self._start, 1e-9)
+        return (f"t: {self.elapsed:6.1f} s, connections: {self.connected}, "
+                f"connections/s: {self.connected / connecting:.0f}, games: {self.games}, "
+                f"games/s: {self.games / self.elapsed:.1f}, turns: {self.turns.count}, "
+                + ", ".join(f"p{p} ms: {1e3 * value:.2f}" for p, value in self.turns.percentiles().items())
+                + f", quits: {self.quits}, opponent left: {self.left}, errors: {sum(self.errors.values())} {dict(self.errors)}")
+
+
+class Bot(object):
+
+    def __init__(self, ip_address, report, codec, think_time, strategy, leave_probability, quit_probability,
+                 timeout, seed):
+        """
+        Constructor.
+        Headless player. Game logic is PlayerCore, messages are
+        handled by the same Commands as in battleship.py, and the bot
+        only decides what the user would: where to place the fleet,
+        where to strike, whether to quit in the middle of the game,
+        and whether to stay or leave after the game.
+        Bot is also the player's connection, Commands send through it.
+        :param ip_address: str
+        :param report: <class Report>
+        :param codec: int
+        :param think_time: float
+        :param strategy: str
+        :param leave_probability: float
+        :param quit_probability: float
+        :param timeout: float
+        :param seed: int
+        """
+        self._ip_address = ip_address
+        self._report = report
+        self._codec = codec
+        self._think_time = think_time
+        self._strategy = strategy
+        self._leave_probability = leave_probability
+        self._quit_probability = quit_probability
+        self._timeout = timeout
+        self._rng = random.Random(seed)
+        self._reader = None
+        self._writer = None
+        self._player = None
+        self._commands = None
+        self._targets = []  # cells to strike first, next to the hits ("hunt" strategy)
+        self._strike_time = None
+
+    async def run(self, stop):
+        """
+        Connects and plays games until stop event is set.
+        Reconnects after leaving the server.
+        :param stop: <class Event>
+        :return: None
+        """
+        while not stop.is_set():
+            try:
+                self._reader, self._writer = await asyncio.open_connection(self._ip_address, Communication._port)
+            except OSError:
+                self._report.errors["connect"] += 1
+                await asyncio.sleep(1)
+                continue
+            self._report.connection()
+            self._player = PlayerCore(connection=self, username="bot")
+            self._commands = Commands(player=self._player, inbox_size=1)    # bot calls handle, inbox is not used
+            try:
+                await self._session(stop=stop)
+            except asyncio.TimeoutError:
+                self._report.errors["timeout"] += 1
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self._report.errors["disconnect"] += 1
+            finally:
+                self.close()
+        return
+
+    async def _session(self, stop):
+        """
+        One connection to the server.
+        Returns when bot leaves or quits the server, or stop event is set.
+        :param stop: <class Event>
+        :return: None
+        """
+        Communication.send_(connection=self, message=f"{Constants.CMD_CODEC};{self._codec}")
+        while not stop.is_set():
+            in_game = self._player.in_game
+            if in_game:
+                key, parameters = await asyncio.wait_for(self.receive(), timeout=self._timeout)
+            else:   # in lobby, bot waits as long as it takes to find the opponent
+                key, parameters = await self.receive()
+            if key == Constants.CMD_STRIKE and parameters.strip('-').isdigit():     # result of our strike
+                self._report.turns.add(time.perf_counter() - self._strike_time)
+                self._hunt(type_=int(parameters))
+            elif key == Constants.CMD_STRIKE and parameters == "all":   # we won
+                self._report.games += 1
+            elif key == Constants.CMD_LEFT:     # opponent quit in the middle of the game
+                self._report.left += 1
+            elif key not in (Constants.CMD_CODEC, Constants.CMD_GAME, Constants.CMD_DEFEND, Constants.CMD_STRIKE):
+                self._report.errors["unexpected"] += 1
+            self._commands.handle(key=key, parameters=parameters)
+
+            if key == Constants.CMD_GAME and self._player.in_game:
+                self._player.board.place_random(rng=self._rng)
+                self._targets = []
+                self._commands.ready("fleet")
+            if self._player.attack:
+                if self._quit():
+                    return
+                await self._strike()
+            if in_game and not self._player.in_game and self._game_over():
+                return
+
+    def sendall(self, data):
+        """
+        Connection method for Communication.send_.
+        :param data: bytes
+        :return: None
+        """
+        self._writer.write(data)
+        return
+
+    def close(self):
+        """
+        Connection method for Commands.left.
+        :return: None
+        """
+        self._writer.close()
+        return
+
+    async def receive(self):
+        """
+        Receives the next message.
+        :return: tuple :: (str, str)
+        """
+        header = await self._reader.readexactly(Framing.HEADER_SIZE)
+        return Codec.decode(await self._reader.readexactly(Framing.length(header)))
+
+    def _game_over(self):
+        """
+        Bot either stays for the next game, or leaves the server.
+        Returns True if bot has left.
+        :return: bool
+        """
+        if self._rng.random() < self._leave_probability:
+            Communication.send_(connection=self, message=f"{Constants.CMD_LEFT};")
+            return True
+        self._commands.stay()
+        return False
+
+    def _quit(self):
+        """
+        On its turn, bot may quit in the middle of the game,
+        either with "-left;" or by just dropping the connection.
+        Returns True if bot has quit, connection is closed by run.
+        :return: bool
+        """
+        if self._rng.random() >= self._quit_probability:
+            return False
+        self._report.quits += 1
+        if self._rng.random() < 0.5:
+            Communication.send_(connection=self, message=f"{Constants.CMD_LEFT};")
+        return True
+
+    async def _strike(self):
+        """
+        Thinks, picks the cell and strikes.
+        :return: None
+        """
+        if self._think_time > 0:
+            await asyncio.sleep(self._rng.uniform(0, 2 * self._think_time))
+        board = self._player.opponent_board
+        cell = None
+        while self._targets and (cell is None or board.is_hit(*cell)):
+            cell = self._targets.pop()
+        if cell is None or board.is_hit(*cell):
+            cell = self._rng.choice([(i, j) for i in range(board.size) for j in range(board.size)
+                                     if not board.is_hit(i, j)])
+        self._strike_time = time.perf_counter()
+        self._commands.strike(*cell, send=True)
+        return
+
+    def _hunt(self, type_):
+        """
+        After a hit, "hunt" strategy strikes next to it.
+        :param type_: int
+        :return: None
+        """
+        if type_ != Constants.EMPTY and self._strategy == "hunt":
+            i, j = self._player.striking_cell
+            for cell in ((i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)):
+                if self._player.opponent_board.contains(*cell):
+                    self._targets.append(cell)
+        return
+
+
+async def _report_periodically(report, interval, stop):
+    """
+    Prints the report every interval seconds.
+    :param report: <class Report>
+    :param interval: float
+    :param stop: <class Event>
+    :return: None
+    """
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            print(report, flush=True)
+    return
+
+
+async def _load(args):
+    """
+    Starts the bots, one every ramp / n seconds,
+    and stops them after duration seconds.
+    Stopped bots just close their connections,
+    bots waiting in the lobby are cancelled.
+    :param args: <class Namespace>
+    :return: str
+    """
+    report = Report()
+    stop = asyncio.Event()
+    reporter = asyncio.create_task(_report_periodically(report=report, interval=args.report_interval, stop=stop))
+    bots = []
+    for k in range(args.n):
+        bot = Bot(ip_address=args.ip_address, report=report, codec=args.codec, think_time=args.think_time,
+                  strategy=args.strategy, leave_probability=args.leave_probability,
+                  quit_probability=args.quit_probability, timeout=args.timeout, seed=args.seed + k)
+        bots.append(asyncio.create_task(bot.run(stop=stop)))
+        if args.ramp > 0:
+            await asyncio.sleep(args.ramp / args.n)
+    await asyncio.sleep(max(args.duration - report.elapsed, 0))
+    stop.set()
+    result = str(report)    # before the bots are stopped, so their disconnects are not counted
+    for bot in bots:
+        bot.cancel()
+    await asyncio.gather(*bots, reporter, return_exceptions=True)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Battleship load generator, headless bots against server.py.")
+    parser.add_argument("-n", type=int, default=1000, help="number of bots")
+    parser.add_argument("--ip-address", default="127.0.0.1")
+    parser.add_argument("--ramp", type=float, default=10, help="seconds to start all bots")
+    parser.add_argument("--duration", type=float, default=60, help="seconds, ramp included")
+    parser.add_argument("--think-time", type=float, default=0, help="mean seconds before each strike")
+    parser.add_argument("--strategy", choices=["random", "hunt"], default="hunt")
+    parser.add_argument("--leave-probability", type=float, default=0, help="chance to leave the server and reconnect after each game")
+    parser.add_argument("--quit-probability", type=float, default=0,
+                        help="chance to quit on each own turn, in the middle of the game")
+    parser.add_argument("--codec", type=int, choices=Codec.VERSIONS, default=Constants.CODEC_VERSION)
+    parser.add_argument("--timeout", type=float, default=30, help="seconds to wait for the opponent in game")
+    parser.add_argument("--report-interval", type=float, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    Logger._logger = False
+    Limits.raise_open_files()
+    print(asyncio.run(_load(args)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: board
+
+from packages.public.bitboard import Bitboard
+from packages.public.constants import Constants
+
+
+class Board(object):
+
+    def __init__(self, size=Constants.GRID_SIZE):
+        """
+        Constructor.
+        Game logic of one grid, without any pygame object.
+        Board is kept in bitboards (see Bitboard), so placement,
+        strikes, sunk and defeat checks are a few bitwise operations.
+        Player's board holds his fleet, opponent's board holds
+        what player has learned by striking.
+        Grid boxes only show the board.
+        :param size: int
+        """
+        self._size = size
+        self._occupancy = 0     # cells taken by boats
+        self._shots = 0     # struck cells
+        self._types = [0] * len(Constants.BOAT_SIZES)     # cells of each boat type
+        self._boats = []    # mask of each placed boat
+
+    @property
+    def size(self):
+        """
+        Getter.
+        :return: int
+        """
+        return self._size
+
+    @property
+    def occupancy(self):
+        """
+        Getter. Returns the mask of all boats.
+        :return: int
+        """
+        return self._occupancy
+
+    @property
+    def shots(self):
+        """
+        Getter. Returns the mask of struck cells.
+        :return: int
+        """
+        return self._shots
+
+    def contains(self, i, j):
+        """
+        Returns if cell (i, j) is on the board.
+        :param i: int
+        :param j: int
+        :return: bool
+        """
+        return 0 <= i < self._size and 0 <= j < self._size
+
+    def type_at(self, i, j):
+        """
+        Returns the boat type at cell (i, j), Constants.EMPTY for the sea.
+        :param i: int
+        :param j: int
+        :return: int
+        """
+        bit = Bitboard.bit(i, j)
+        if self._occupancy & bit:
+            for type_, mask in enumerate(self._types):
+                if mask & bit:
+                    return type_
+        return Constants.EMPTY
+
+    def shape(self, i, j, size, direction):
+        """
+        Returns the cells of the shape with head at (i, j),
+        given size and direction. Cells that would be outside
+        of the board are left out, so the shape can be shorter than size.
+        :param i: int
+        :param j: int
+        :param size: int
+        :param direction: str
+        :return: list
+        """
+        di, dj = {Constants.DIR_LEFT: (0, -1), Constants.DIR_RIGHT: (0, 1),
+                  Constants.DIR_UP: (-1, 0), Constants.DIR_DOWN: (1, 0)}[direction]
+        cells = []
+        for k in range(size):
+            if not self.contains(i + k * di, j + k * dj):
+                break
+            cells.append((i + k * di, j + k * dj))
+        return cells
+
+    def is_free(self, cells):
+        """
+        Returns if none of the cells is taken by a boat.
+        :param cells: list
+        :return: bool
+        """
+        return not self._occupancy & Bitboard.mask(cells)
+
+    def can_place(self, cells, size):
+        """
+        Returns if boat of given size can be placed on the cells.
+        :param cells: list
+        :param size: int
+        :return: bool
+        """
+        return len(cells) == size and self.is_free(cells)
+
+    def place(self, cells, type_):
+        """
+        Places boat of given type on the cells.
+        Returns False if any of the cells is taken.
+        :param cells: list
+        :param type_: int
+        :return: bool
+        """
+        return self.place_mask(Bitboard.mask(cells), type_)
+
+    def place_mask(self, mask, type_):
+        """
+        Places boat of given type on the cells of the mask.
+        Returns False if any of the cells is taken.
+        :param mask: int
+        :param type_: int
+        :return: bool
+        """
+        if self._occupancy & mask:
+            return False
+        self._occupancy |= mask
+        self._types[type_] |= mask
+        self._boats.append(mask)
+        return True
+
+    def place_random(self, rng):
+        """
+        Places the whole fleet at random, the same boats
+        that the player draws.
+        :param rng: <class Random>
+        :return: None
+        """
+        for type_, (size, quantity) in enumerate(zip(Constants.BOAT_SIZES, Constants.BOAT_QUANTITY)):
+            placements = Bitboard.BY_SIZE[size]
+            for _ in range(quantity):
+                while not self.place_mask(rng.choice(placements), type_):
+                    pass
+        return
+
+    def masks(self):
+        """
+        Returns bitboard mask of each placed boat,
+        that is how the fleet is sent to the server.
+        :return: list
+        """
+        return list(self._boats)
+
+    def strike(self, i, j):
+        """
+        Opponent strikes at (i, j).
+        Returns the boat type at that cell, Constants.EMPTY for a miss.
+        :param i: int
+        :param j: int
+        :return: int
+        """
+        if not self.contains(i, j):
+            raise ValueError("Invalid strike coordinates!")
+        self._shots |= Bitboard.bit(i, j)
+        return self.type_at(i, j)
+
+    def mark(self, i, j, type_):
+        """
+        Marks the result of player's strike at (i, j).
+        :param i: int
+        :param j: int
+        :param type_: int
+        :return: None
+        """
+        bit = Bitboard.bit(i, j)
+        self._shots |= bit
+        if type_ != Constants.EMPTY:
+            self._occupancy |= bit
+            self._types[type_] |= bit
+        return
+
+    def is_hit(self, i, j):
+        """
+        Returns if cell (i, j) has been struck.
+        :param i: int
+        :param j: int
+        :return: bool
+        """
+        return bool(self._shots & Bitboard.bit(i, j))
+
+    def sunk(self, i, j):
+        """
+        Returns the mask of the boat at (i, j) if all of its
+        cells are struck, 0 otherwise.
+        :param i: int
+        :param j: int
+        :return: int
+        """
+        bit = Bitboard.bit(i, j)
+        for mask in self._boats:
+            if mask & bit:
+                return mask if not mask & ~self._shots else 0
+        return 0
+
+    def is_defeated(self):
+        """
+        Returns if all boats are hit.
+        :return: bool
+        """
+        return not self._occupancy & ~self._shots
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: commands
+
+import time
+import threading
+from packages.structures.queue import SPSCRingBuffer
+from packages.public.bitboard import Bitboard
+from packages.public.constants import Constants
+from packages.public.communication import Communication
+from packages.public.logger import Logger
+from packages.public.stats import Stats
+
+
+class Commands(SPSCRingBuffer):
+
+    def __init__(self, player, inbox_size=Constants.INBOX_SIZE):
+        """
+        Constructor. Extends the SPSCRingBuffer class.
+        Parameter player represends the player.
+        Class Commands takes care of commands
+        that server sends to the player.
+        Then, for each command,
+        calls appropriate method.
+        Trace thread is the only producer and
+        the main (drawing) thread is the only consumer of the inbox.
+        With dispatch, trace thread handles messages by itself,
+        as soon as they come, see dispatch setter.
+        Headless player that calls handle by itself never
+        uses the inbox, so it can pass inbox size of 1.
+        :param player: <class player>
+        :param inbox_size: int
+        """
+        self._player = player
+        super().__init__(capacity=inbox_size)
+        self._thread = threading.Thread(target=self.trace)  # our thread
+        self._running = False
+        self._depths = Stats(size=Constants.INBOX_STATS_SIZE)   # pending messages, on each check
+        self._ages = Stats(size=Constants.INBOX_STATS_SIZE)     # seconds from receive to handling
+        self._on_receive = None     # function, called by trace thread when a message comes into the empty inbox
+        self._dispatch = False  # True if trace thread handles messages, without the inbox
+        self._lock = threading.RLock()  # held while handling messages, and by the main thread while it uses the player
+
+    @property
+    def depths(self):
+        """
+        Getter. Returns stats of inbox depth, sampled on each check.
+        :return: <class Stats>
+        """
+        return self._depths
+
+    @property
+    def ages(self):
+        """
+        Getter. Returns stats of message age (seconds) when handled.
+        :return: <class Stats>
+        """
+        return self._ages
+
+    @property
+    def on_receive(self):
+        """
+        Getter.
+        :return: function
+        """
+        return self._on_receive
+
+    @on_receive.setter
+    def on_receive(self, value):
+        """
+        Setter. Function is called from the trace thread,
+        so the main thread can wait for messages instead of polling.
+        :param value: function
+        :return: None
+        """
+        self._on_receive = value
+        return
+
+    @property
+    def dispatch(self):
+        """
+        Getter.
+        :return: bool
+        """
+        return self._dispatch
+
+    @dispatch.setter
+    def dispatch(self, value):
+        """
+        Setter. If True, trace thread handles each message as soon
+        as it comes, instead of putting it into the inbox for check.
+        Main thread must hold the lock while it uses the player.
+        :param value: bool
+        :return: None
+        """
+        self._dispatch = value
+        return
+
+    @property
+    def lock(self):
+        """
+        Getter.
+        :return: <class RLock>
+        """
+        return self._lock
+
+    def trace(self):        # TODO: Be careful with program exit, and terminating this thread
+        """
+        Constantly receives the messages from the server.
+        Method starts thread, first call is only
+        for start, second is then the thread.
+        Each message is stored with the time it was received.
+        :return: None
+        """
+        if not self._running:
+            self._running = True
+            self._thread.start()
+        else:
+            while self._running:
+                key, parameters = Communication.receive(connection=self._player.connection)
+                if key is None:     # connection is closed
+                    if self._running:   # by the server, not by the player
+                        self._lost()
+                    break
+                if self._dispatch:
+                    with self._lock:
+                        self.handle(key=key, parameters=parameters)
+                    if self._on_receive is not None:    # main thread may be waiting, state has changed
+                        self._on_receive()
+                    continue
+                while not self.enqueue((key, parameters, time.perf_counter())) and self._running:
+                    time.sleep(Constants.INBOX_FULL_SLEEP_TIME)    # inbox is full, player is behind
+                if self._on_receive is not None and len(self) == 1:   # inbox was empty, main thread may be waiting
+                    self._on_receive()
+            Logger.print(message=f"Tracing ended. Inbox depth: {self._depths}, message age (s): {self._ages}",
+                         type_=Logger.INFO)
+        return
+
+    def end_tracing(self):
+        """
+        Ends the trace thread.
+        :return: None
+        """
+        self._running = False
+        return
+
+    def join(self):
+        """
+        Joins the thread.
+        :return: None
+        """
+        self._thread.join()
+        return
+
+    def get(self):
+        """
+        Returns the oldest unread command.
+        If there is no unread commands, returns a tuple
+        (None, None).
+        :return: tuple :: (str, str)
+        """
+        message = self.dequeue()
+        if message is None:
+            return None, None
+        key, parameters, received = message
+        self._ages.add(time.perf_counter() - received)
+        return key, parameters
+
+    def check(self):
+        """
+        Checks the newly received messages from the server.
+        Handles all of them, so a burst of messages is
+        applied in the same frame. The end of the game and the start
+        of the next one can be applied together, so scenes check
+        player's game_over, not in_game.
+        Messages are taken one by one, because handling
+        a command can check the inbox again.
+        :return: None
+        """
+        self._depths.add(len(self))
+        key, parameters = self.get()
+        while key is not None:
+            self.handle(key=key, parameters=parameters)
+            key, parameters = self.get()
+        return
+
+    def handle(self, key, parameters):
+        """
+        Calls the appropriate command method for the received message.
+        :param key: str
+        :param parameters: str
+        :return: None
+        """
+        if not isinstance(parameters, str):
+            return
+        # handle the command
+        if key == Constants.CMD_GAME and self._player.in_lobby:
+            # self._player.in_game = True
+            self.game()
+        elif key == Constants.CMD_LEFT:  # opponent left the game
+            self.opponent_left()
+        elif key == Constants.CMD_STRIKE:
+            if parameters == "":    # we are attacker
+                self.strike()
+            elif '|' in parameters:     # we are attacked
+                self.strike(*parameters.split('|'))
+            elif parameters == "all" or parameters.strip('-').isdigit():
+                # opponent is defeated or informs us about our strike
+                self.strike(parameters)
+        elif key == Constants.CMD_DEFEND:
+            # we are defender
+            self.defend()
+        elif key == Constants.CMD_CODEC:
+            self.codec(parameters)
+        return
+
+    def codec(self, *args):
+        """
+        Without args, player asks the server for his preferred codec version.
+        Server answers with the version that both of them support,
+        and from then on player sends messages with that codec.
+        :return: None
+        """
+        if args == ():
+            Communication.send_(connection=self._player.connection,
+                                message=f"{Constants.CMD_CODEC};{Constants.CODEC_VERSION}")
+        else:
+            Communication.set_codec(connection=self._player.connection, version=int(args[0]))
+        return
+
+    def left(self):
+        """
+        Client (that is, player) closed the game.
+        Connection with server is closing.
+        Informs server about leaving.
+        :return: None
+        """
+        Communication.send_(connection=self._player.connection, message=f"{Constants.CMD_LEFT};")
+        self._player.in_game = False
+        self._player.connection.close()
+        return
+
+    def stay(self):
+        """
+        Player stays on the server after the game,
+        server pairs him for the next one.
+        :return: None
+        """
+        Communication.send_(connection=self._player.connection, message=f"{Constants.CMD_STAY};")
+        return
+
+    def opponent_left(self):
+        """
+        Opponent left the game, player wins.
+        Server returns the player to the lobby.
+        :return: None
+        """
+        self._player.end_game(won=True)
+        return
+
+    def _lost(self):
+        """
+        Connection with the server is lost,
+        game is over and player is disconnected.
+        :return: None
+        """
+        with self._lock:
+            self._player.end_game(won=False)
+            self._player.connected = False
+        if self._on_receive is not None:    # main thread may be waiting
+            self._on_receive()
+        return
+
+    def game(self):
+        """
+        Player joins the game.
+        Game screen must be shown.
+        Starts with fleet drawing.
+        When finished, sends ready to server.
+        :return: None
+        """
+        self._player.new_game()
+        self._player.in_game = True
+        return
+
+    def ready(self, *args):
+        """
+        Player is ready for the game.
+        Args can contain additional parameters,
+        such as "fleet" for specifing for what
+        is client ready. With "fleet", player's
+        fleet is sent too, as the mask of each boat.
+        :return: None
+        """
+        if args == ("fleet", ):     # server keeps the fleet and resolves the strikes
+            args += (Bitboard.encode(self._player.board.masks()), )
+        parameters = '|'.join(args)
+        Communication.send_(connection=self._player.connection, message=f"{Constants.CMD_READY};{parameters}")
+
+    def strike(self, *args, **kwargs):
+        """
+        Several options for this command.
+        Player can receive an empty command
+        (no parameters). That means he is
+        attacking.
+        Then, attacker sends this command with
+        cell (i, j) parameters, keyword send=True.
+        Server resolves the strike: attacker receives
+        box type (-1, 0, 1, ...) of that cell,
+        and defender receives the same cell (i, j),
+        so both of them can show it.
+        If defender is defeated, attacker also receives
+        "-strike;all".
+        :param args: tuple
+        :param kwargs: dict
+        :return: None
+        """
+        send = False
+        if "send" in kwargs.keys():
+            send = kwargs["send"]
+            if not isinstance(send, bool):
+                raise TypeError(f"Send must be bool type, got {type(send)} instead.")
+
+        # case 1: player will be attacker
+        if args == ():
+            self._player.attack = True  # this will end while loop in defend method
+        elif len(args) == 1:    # case 2 and 3: -strike;type or -strike;all (receive)
+            value = args[0]
+            if value.strip('-').isdigit():  # box type
+                self._player.mark_box_type(int(value))
+            else:   # all - win!
+                # end of the game
+                self._player.end_game(won=True)
+        elif len(args) == 2:    # case 4: -strike;i|j (send, receive)
+            if send:    # attacker
+                self._player.aim(int(args[0]), int(args[1]))
+                Communication.send_(connection=self._player.connection,
+                                    message=f"{Constants.CMD_STRIKE};{str(args[0])}|{str(args[1])}")
+            else:   # defender
+                self._player.check_strike(int(args[0]), int(args[1]))
+                # check if player lost, server has already ended the game
+                if self._player.is_defeated():
+                    self._player.end_game(won=False)
+
+    def defend(self):
+        """
+        Client receives this message when opponent is attacking him.
+        This is also indicator of the game start as well as the new turn.
+        :return: None
+        """
+        self._player.attack = False
+        self._player.defend()
+        return
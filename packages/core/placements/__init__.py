@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: placements
+
+from packages.core.board import Board
+from packages.public.bitboard import Bitboard
+from packages.public.constants import Constants
+
+
+class Placements(object):
+    """
+    Index of legal boat placements on the player's board.
+    Placement is (i, j, size, direction), with head at (i, j).
+    Index is updated when a boat is placed, so checking the shape
+    under the mouse is a set lookup, without creating anything.
+    """
+    DIRECTIONS = (Constants.DIR_RIGHT, Constants.DIR_DOWN, Constants.DIR_LEFT, Constants.DIR_UP)
+
+    def __init__(self, board):
+        """
+        Constructor.
+        Indexes every placement that is legal on the board.
+        :param board: <class Board>
+        """
+        self._board = board
+        self._legal = {size: set() for size in set(Constants.BOAT_SIZES)}   # legal placements, for each boat size
+        for key, (mask, cells) in Placements.TABLE.items():
+            if len(cells) == key[2] and not board.occupancy & mask:
+                self._legal[key[2]].add(key)
+
+    @property
+    def board(self):
+        """
+        Getter.
+        :return: <class Board>
+        """
+        return self._board
+
+    @staticmethod
+    def cells(i, j, size, direction):
+        """
+        Returns the cells of the placement.
+        Cells outside of the board are left out (see Board.shape).
+        :param i: int
+        :param j: int
+        :param size: int
+        :param direction: str
+        :return: tuple
+        """
+        return Placements.TABLE[(i, j, size, direction)][1]
+
+    def is_legal(self, i, j, size, direction):
+        """
+        Returns if boat can be placed there.
+        :param i: int
+        :param j: int
+        :param size: int
+        :param direction: str
+        :return: bool
+        """
+        return (i, j, size, direction) in self._legal[size]
+
+    def count(self, size):
+        """
+        Returns the number of legal placements for given boat size.
+        :param size: int
+        :return: int
+        """
+        return len(self._legal[size])
+
+    def place(self, i, j, size, direction):
+        """
+        Places the boat on the board and removes placements
+        that overlap it from the index.
+        Returns False if placement is not legal.
+        :param i: int
+        :param j: int
+        :param size: int
+        :param direction: str
+        :return: bool
+        """
+        key = (i, j, size, direction)
+        if key not in self._legal[size]:
+            return False
+        mask = Placements.TABLE[key][0]
+        self._board.place_mask(mask, Constants.BOAT_SIZES.index(size))
+        for cell in Bitboard.cells(mask):
+            for key_ in Placements.BY_CELL[cell]:
+                self._legal[key_[2]].discard(key_)
+        return True
+
+    def complete(self, sizes, rng):
+        """
+        Returns placements for all given boat sizes, in that order,
+        that fit the board together, or None if there are none.
+        Nothing is placed, use place method for each of them.
+        :param sizes: list
+        :param rng: <class Random>
+        :return: list
+        """
+        return self._complete(sizes=list(sizes), occupancy=self._board.occupancy, rng=rng)
+
+    def _complete(self, sizes, occupancy, rng):
+        """
+        Backtracking for the complete method.
+        :param sizes: list
+        :param occupancy: int
+        :param rng: <class Random>
+        :return: list
+        """
+        if not sizes:
+            return []
+        candidates = sorted(key for key in self._legal[sizes[0]] if not Placements.TABLE[key][0] & occupancy)
+        rng.shuffle(candidates)
+        for key in candidates:
+            rest = self._complete(sizes=sizes[1:], occupancy=occupancy | Placements.TABLE[key][0], rng=rng)
+            if rest is not None:
+                return [key] + rest
+        return None
+
+    @staticmethod
+    def _table():
+        """
+        Returns dictionary {(i, j, size, direction): (mask, cells)}
+        for every head, boat size and direction.
+        Mask is 0 if the boat does not fit the board.
+        :return: dict
+        """
+        board = Board()
+        table = {}
+        for size in set(Constants.BOAT_SIZES):
+            for i in range(board.size):
+                for j in range(board.size):
+                    for direction in Placements.DIRECTIONS:
+                        cells = tuple(board.shape(i=i, j=j, size=size, direction=direction))
+                        table[(i, j, size, direction)] = (Bitboard.mask(cells) if len(cells) == size else 0, cells)
+        return table
+
+    @staticmethod
+    def _by_cell():
+        """
+        Returns dictionary {(i, j): placements}
+        of every placement that covers the cell.
+        :return: dict
+        """
+        by_cell = {divmod(index, Bitboard.SIZE): [] for index in range(Bitboard.CELLS)}
+        for key, (mask, cells) in Placements.TABLE.items():
+            if mask:
+                for cell in cells:
+                    by_cell[cell].append(key)
+        return by_cell
+
+
+Placements.TABLE = Placements._table()  # computed once, for all boards
+Placements.BY_CELL = Placements._by_cell()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: player_core
+
+from packages.core.board import Board
+from packages.server.clients.client import Client
+
+
+class PlayerCore(Client):
+
+    def __init__(self, connection, username):
+        """
+        Constructor. Class extends Client class.
+        Game logic of the player, without any pygame object.
+        This is everything that Commands needs from the player,
+        so headless bots use it directly, and pygame Player
+        extends it with drawing and user input.
+        :param connection: <class socket>
+        :param username: str
+        """
+        super().__init__(connection=connection, username=username)
+        self._board = Board()   # player's fleet
+        self._opponent_board = Board()  # what player knows about the opponent's fleet
+        self._won = False
+        self._game_over = None  # result of the game that has ended, until the game over screen takes it
+        self._attack = False    # True when server sends command "-strike;", False when server sends command "-defend;"
+        self._striking_cell = None  # (i, j), remembers the cell that player strikes
+
+    @property
+    def board(self):
+        """
+        Getter.
+        :return: <class Board>
+        """
+        return self._board
+
+    @property
+    def opponent_board(self):
+        """
+        Getter.
+        :return: <class Board>
+        """
+        return self._opponent_board
+
+    @property
+    def won(self):
+        """
+        Getter.
+        :return: bool
+        """
+        return self._won
+
+    @won.setter
+    def won(self, value):
+        """
+        Setter.
+        :param value: bool
+        :return: None
+        """
+        self._won = value
+        return
+
+    @property
+    def game_over(self):
+        """
+        Getter. Returns True or False if the game has ended
+        and its result is not taken yet, None otherwise.
+        New game can start before the old one is shown as ended,
+        so this is kept apart from in_game and won.
+        :return: bool
+        """
+        return self._game_over
+
+    def take_game_over(self):
+        """
+        Returns the result of the ended game and clears it.
+        :return: bool
+        """
+        won, self._game_over = self._game_over, None
+        return won
+
+    @property
+    def attack(self):
+        """
+        Getter.
+        :return: bool
+        """
+        return self._attack
+
+    @attack.setter
+    def attack(self, value):
+        """
+        Setter.
+        :param value: bool
+        :return: None
+        """
+        self._attack = value
+        return
+
+    @property
+    def striking_cell(self):
+        """
+        Getter.
+        :return: tuple :: (int, int)
+        """
+        return self._striking_cell
+
+    def new_game(self):
+        """
+        Clears both boards for the new game.
+        :return: None
+        """
+        self._board = Board()
+        self._opponent_board = Board()
+        self._won = False
+        self._attack = False
+        self._striking_cell = None
+        return
+
+    def end_game(self, won):
+        """
+        Game is over, player goes back to the lobby.
+        Does nothing if player is not in the game.
+        :param won: bool
+        :return: None
+        """
+        if self.in_game:
+            self._won = won
+            self._game_over = won
+            self.in_game = False
+        return
+
+    def aim(self, i, j):
+        """
+        Player (attacker) has picked the cell to strike.
+        :param i: int
+        :param j: int
+        :return: None
+        """
+        self._striking_cell = (i, j)
+        self._attack = False    # player is done with attacking
+        return
+
+    def check_strike(self, i, j):  # defender
+        """
+        Player checks if attacker has hit
+        any of his boats.
+        Returns -1 for False, or
+        Boat Type for True.
+        :param i: int
+        :param j: int
+        :return: int
+        """
+        return self._board.strike(i, j)
+
+    def mark_box_type(self, type_):  # attacker
+        """
+        Player marks type of the striking cell.
+        :param type_: int
+        :return: None
+        """
+        i, j = self._striking_cell
+        self._opponent_board.mark(i, j, type_)
+        return
+
+    def defend(self):
+        """
+        Opponent is attacking.
+        :return: None
+        """
+        return
+
+    def is_defeated(self):
+        """
+        Method checks if player is defeated.
+        :return: bool
+        """
+        return self._board.is_defeated()
+
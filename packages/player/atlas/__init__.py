@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: atlas
+
+import pygame
+from packages.player.box import Box
+from packages.player.window import Window
+from packages.public.constants import Constants
+
+
+class Atlas(object):
+
+    def __init__(self, size):
+        """
+        Constructor.
+        Pre-rendered sprites of the box, one for each box state,
+        so drawing the box is a single blit.
+        State is (kind, color, highlight color), see Window.show_game_screen,
+        None stands for the empty box.
+        Sprites are drawn by the box itself, so they look the same
+        as the box drawn directly on the screen.
+        :param size: int
+        """
+        self._size = size
+        self._sprites = dict()
+        for highlight in (None, Constants.RED, Constants.BLUE):
+            for kind, color in [(None, None), (Window.CELL_MISS, None)] + \
+                               [(kind, color) for kind in (Window.CELL_FILL, Window.CELL_HIT)
+                                for color in Constants.BOAT_COLORS + [Constants.BLACK]]:
+                self.sprite((kind, color, highlight))
+
+    @property
+    def size(self):
+        """
+        Getter.
+        :return: int
+        """
+        return self._size
+
+    def __len__(self):
+        """
+        Returns the number of sprites.
+        :return: int
+        """
+        return len(self._sprites)
+
+    def sprite(self, state):
+        """
+        Returns the sprite of the box state.
+        State that is not in the atlas yet is rendered and added.
+        :param state: tuple or None
+        :return: <class Surface>
+        """
+        state = state or (None, None, None)
+        sprite = self._sprites.get(state)
+        if sprite is None:
+            sprite = self._sprites[state] = self._render(state)
+        return sprite
+
+    def _render(self, state):
+        """
+        Renders the sprite of the box state.
+        :param state: tuple
+        :return: <class Surface>
+        """
+        kind, color, highlight = state
+        sprite = pygame.Surface((self._size, self._size))
+        sprite.fill(Constants.BGCOLOR)
+        box = Box(pygame.Rect(0, 0, self._size, self._size), grid=None, cell=None)
+        box.color = color
+        if kind == Window.CELL_FILL:
+            box.fill(sprite)
+        elif kind == Window.CELL_HIT:
+            box.hit(sprite)
+        elif kind == Window.CELL_MISS:
+            box.miss(sprite)
+        if highlight is not None:
+            box.highlight(sprite, highlight)
+        return sprite
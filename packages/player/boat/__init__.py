@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 # package name: boat
 
+from packages.player.window import Window
 from packages.public.constants import Constants
 
 
@@ -16,8 +17,7 @@ class Boat(object):
         """
         self._shape = shape
         for box in self.shape:
-            box.type = Constants.BOAT_SIZES.index(self._shape.size)
-            box.color = Constants.BOAT_COLORS[box.type]
+            box.color = Constants.BOAT_COLORS[Constants.BOAT_SIZES.index(self._shape.size)]
 
     @property
     def shape(self):
@@ -34,10 +34,7 @@ class Boat(object):
         :return: None
         """
         for box in self._shape.get:     # TODO: make this and other object iterable etc.
-            if box.is_hit:
-                box.hit(surface)
-            else:
-                box.fill(surface)
+            box.draw(surface, (Window.CELL_HIT if box.is_hit else Window.CELL_FILL, box.color, None))
         return
 
     @staticmethod
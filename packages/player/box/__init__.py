@@ -10,19 +10,23 @@ from packages.player.window import Window
 
 class Box(Area):
 
-    def __init__(self, rect):
+    def __init__(self, rect, grid, cell):
         """
         Constructor.
         Rect (that is, rectangle) is object that defines space (position)
         on screen for our box.
         Difference between total size and size is that total size
         includes both left and right box margins.
+        Box is only a view of the cell (i, j) of the grid's board,
+        type and hit come from the board.
         :param rect: <class Rect>
+        :param grid: <class Grid>
+        :param cell: tuple :: (int, int)
         """
         super().__init__(area=rect)
 
-        self._hit = False   # True if boat has been hit on that place
-        self._type = Constants.EMPTY     # boat type, -1 for empty box ("sea")
+        self._grid = grid
+        self._cell = cell
         self._color = None  # color of the box
 
     @property
@@ -35,30 +39,33 @@ class Box(Area):
         """
         return self.width - 2 * Constants.BOX_MARGIN
 
+    @property
+    def cell(self):
+        """
+        Getter. Returns (i, j) of the box.
+        :return: tuple :: (int, int)
+        """
+        return self._cell
+
     @property
     def is_hit(self):
         """
-        Getter.
+        Getter. Returns True if boat has been hit on that place.
         :return: bool
         """
-        return self._hit
+        board = self._grid.board
+        return board is not None and board.is_hit(*self._cell) and board.type_at(*self._cell) != Constants.EMPTY
 
     @property
     def type(self):
         """
-        Getter.
+        Getter. Returns boat type, -1 for empty box ("sea").
         :return: int
         """
-        return self._type
-
-    @type.setter
-    def type(self, value):
-        """
-        Setter.
-        :return: None
-        """
-        self._type = value
-        return
+        board = self._grid.board
+        if board is None:
+            return Constants.EMPTY
+        return board.type_at(*self._cell)
 
     @property
     def color(self):
@@ -88,6 +95,17 @@ class Box(Area):
                                                 self.size, self.size))
         return
 
+    def draw(self, surface, state):
+        """
+        Draws the box in given state,
+        a single blit of the sprite from the grid's atlas.
+        :param surface: <class Surface>
+        :param state: tuple or None
+        :return: None
+        """
+        surface.blit(self._grid.atlas.sprite(state), self.area)
+        return
+
     def highlight(self, surface, color):
         """
         Highlights the box with given color.
@@ -100,7 +118,7 @@ class Box(Area):
 
     def hit(self, surface):
         """
-        Hits the box.
+        Draws the hit box.
         This happens when opponent hits
         the box.
         :param surface: <class Surface>
@@ -112,7 +130,6 @@ class Box(Area):
                                         fg=Constants.WHITE, bg=Constants.BLACK)
         rect.center = self.area.center
         surface.blit(surf, rect)
-        self._hit = True
         return
 
     def reveal(self, surface):
@@ -121,7 +138,6 @@ class Box(Area):
         :param surface: <class Surface>
         :return: None
         """
-        self._hit = True
         self.fill(surface=surface)
 
     def miss(self, surface):
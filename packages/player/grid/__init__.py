@@ -3,7 +3,9 @@
 # package name: grid
 
 import pygame
+from packages.player.atlas import Atlas
 from packages.player.box import Box
+from packages.player.window import Window
 from packages.player.area import Area
 from packages.public.constants import Constants
 
@@ -30,10 +32,14 @@ class Grid(Area):
         self._highlight_border_width = highlight_border_width
 
         self._grid = []   # matrix
+        self._lines = []  # separators, (start, end) of each line
+        self._board = None  # <class Board>, boxes show its cells
+        self._atlas = None  # <class Atlas>, sprites of the boxes, created when first needed
 
         width = self.width - 2 * self._border_width    # width without border margins
         width -= Constants.SEPARATOR_WIDTH * (self._size - 1)   # width without separators (that is, grid lines)
         self._box_total_size = width / self._size   # size with box margins
+        self._pitch = self._box_total_size + Constants.SEPARATOR_WIDTH  # distance between two neighbouring boxes
 
         self._create()  # creates the grid (NO GUI, only data structure)
 
@@ -53,6 +59,34 @@ class Grid(Area):
         """
         return self._box_total_size
 
+    @property
+    def board(self):
+        """
+        Getter.
+        :return: <class Board>
+        """
+        return self._board
+
+    @board.setter
+    def board(self, value):
+        """
+        Setter.
+        :param value: <class Board>
+        :return: None
+        """
+        self._board = value
+        return
+
+    @property
+    def atlas(self):
+        """
+        Getter. Sprites are rendered the first time they are needed.
+        :return: <class Atlas>
+        """
+        if self._atlas is None:
+            self._atlas = Atlas(size=int(self._box_total_size))
+        return self._atlas
+
     @property
     def size(self):
         """
@@ -107,26 +141,44 @@ class Grid(Area):
         for i in range(self._size):
             row = []
             for j in range(self._size):
-                rect = pygame.Rect(offset_x + j * (self._box_total_size + Constants.SEPARATOR_WIDTH),
-                                   offset_y + i * (self._box_total_size + Constants.SEPARATOR_WIDTH),
+                rect = pygame.Rect(offset_x + j * self._pitch,
+                                   offset_y + i * self._pitch,
                                    self._box_total_size,
                                    self._box_total_size)
-                row.append(Box(rect))
+                row.append(Box(rect, grid=self, cell=(i, j)))
             self._grid.append(row)
 
+        # separators, computed once
+        line_lenght = self.width - 2 * self._border_width
+        line_width = Constants.SEPARATOR_WIDTH
+        for box in self._grid[0][1:]:     # vertical
+            self._lines.append(((box.x - line_width, box.y), (box.x - line_width, box.y + line_lenght)))
+        for row in self._grid[1:]:     # parallel
+            box = row[0]
+            self._lines.append(((box.x, box.y - line_width), (box.x + line_lenght, box.y - line_width)))
+
     def get_box_at_pixel(self, x, y):
         """
         Returns the box that contains (x, y) pixel.
         If none of them contains, returns None
+        (pixel is on the border or on the separator).
+        Row and column are calculated from the offset and the box pitch,
+        so the lookup does not depend on the grid size.
         :param x: int
         :param y: int
         :return: <class Box> or None
         """
-        for row in self._grid:
-            for box in row:
-                if box.area.collidepoint(x, y):
-                    return box
-        return None
+        dx = x - self.x - self._border_width
+        dy = y - self.y - self._border_width
+        if dx < 0 or dy < 0:
+            return None
+        i, j = int(dy // self._pitch), int(dx // self._pitch)
+        if i >= self._size or j >= self._size:
+            return None
+        box = self._grid[i][j]
+        if not box.area.collidepoint(x, y):     # separator between boxes
+            return None
+        return box
 
     def draw(self, surface, color1, color2, color3):
         """
@@ -141,17 +193,15 @@ class Grid(Area):
         :param color3: str
         :return: None
         """
+        Window.PROFILER.begin("grids")
         # draw lines
-        line_lenght = self.width - 2 * self._border_width
-        line_width = Constants.SEPARATOR_WIDTH
-        for box in self.row(0)[1:]:     # vertical
-            pygame.draw.line(surface, color3, (box.x - line_width, box.y), (box.x - line_width, box.y + line_lenght), line_width)
-        for box in self.column(0)[1:]:  # parallel
-            pygame.draw.line(surface, color3, (box.x, box.y - line_width), (box.x + line_lenght, box.y - line_width), line_width)
+        for start, end in self._lines:
+            pygame.draw.line(surface, color3, start, end, Constants.SEPARATOR_WIDTH)
 
         # draw borders
         pygame.draw.rect(surface, color1, self.area, self._border_width)
         pygame.draw.rect(surface, color2, self.area, self._highlight_border_width)
+        Window.PROFILER.end("grids")
         return
 
     def get_index_of(self, box):
@@ -162,9 +212,9 @@ class Grid(Area):
         :param box: <class Box>
         :return: tuple :: (int, int)
         """
-        for i in range(self._size):
-            for j in range(self._size):
-                box_ = self._grid[i][j]
-                if box_ == box:
-                    return i, j
-        return None, None
\ No newline at end of file
+        if box is None:
+            return None, None
+        i, j = box.cell
+        if self._grid[i][j] is not box:     # box of the other grid
+            return None, None
+        return i, j
\ No newline at end of file
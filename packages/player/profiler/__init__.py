@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: profiler
+
+import csv
+import json
+import time
+from packages.public.stats import Stats
+
+
+class Profiler(object):
+
+    def __init__(self, size):
+        """
+        Constructor.
+        Times the phases of each frame (drawing, server commands,
+        events, display update...) and keeps the last size frames,
+        so percentiles are rolling.
+        Phase can run more than once in a frame, its frame time is the sum.
+        :param size: int
+        """
+        self._size = size
+        self._frames = Stats(size=size)     # whole frame, ms
+        self._phases = dict()   # {name: <class Stats>}, ms per frame
+        self._current = dict()  # {name: seconds}, in the current frame
+        self._samples = dict()  # {name: <class Stats>}, ms of each sample, e.g. input latency
+        self._started = dict()  # {name: start time} of running phases
+        self._frame_start = time.perf_counter()
+        self._overlay = False   # True if profiler is shown on the screen
+
+    @property
+    def frames(self):
+        """
+        Getter.
+        :return: <class Stats>
+        """
+        return self._frames
+
+    @property
+    def phases(self):
+        """
+        Getter.
+        :return: dict
+        """
+        return self._phases
+
+    @property
+    def samples(self):
+        """
+        Getter.
+        :return: dict
+        """
+        return self._samples
+
+    @property
+    def overlay(self):
+        """
+        Getter.
+        :return: bool
+        """
+        return self._overlay
+
+    @overlay.setter
+    def overlay(self, value):
+        """
+        Setter.
+        :param value: bool
+        :return: None
+        """
+        self._overlay = value
+        return
+
+    def begin(self, name):
+        """
+        Starts timing the phase.
+        :param name: str
+        :return: None
+        """
+        self._started[name] = time.perf_counter()
+        return
+
+    def end(self, name):
+        """
+        Stops timing the phase.
+        :param name: str
+        :return: None
+        """
+        start = self._started.pop(name, None)
+        if start is not None:
+            self._current[name] = self._current.get(name, 0) + time.perf_counter() - start
+        return
+
+    def sample(self, name, value):
+        """
+        Adds the sample that is not a part of the frame,
+        like time from the input to the screen.
+        :param name: str
+        :param value: float, ms
+        :return: None
+        """
+        if name not in self._samples:
+            self._samples[name] = Stats(size=self._size)
+        self._samples[name].add(value)
+        return
+
+    def frame(self):
+        """
+        Ends the frame, adds its time and time of each phase.
+        Phases that did not run in this frame take 0 ms.
+        :return: None
+        """
+        now = time.perf_counter()
+        self._frames.add(1e3 * (now - self._frame_start))
+        self._frame_start = now
+        for name in self._current:
+            if name not in self._phases:
+                self._phases[name] = Stats(size=self._size)
+        for name, stats in self._phases.items():
+            stats.add(1e3 * self._current.get(name, 0))
+        self._current = dict()
+        return
+
+    def summary(self):
+        """
+        Returns mean and percentiles of the frame, each phase
+        and each kind of sample, in ms.
+        :return: dict
+        """
+        summary = dict()
+        for name, stats in [("frame", self._frames)] + sorted(self._phases.items()) + sorted(self._samples.items()):
+            summary[name] = {"mean": stats.mean(), **{f"p{p}": value for p, value in stats.percentiles().items()}}
+        return summary
+
+    def lines(self):
+        """
+        Returns the summary as text lines, for the overlay.
+        :return: list
+        """
+        lines = [f"{'ms':<15}{'mean':>7}{'p50':>7}{'p90':>7}{'p99':>7}"]
+        for name, values in self.summary().items():
+            lines.append(f"{name:<15}" + "".join(f"{value:>7.2f}" for value in values.values()))
+        return lines
+
+    def dump(self, path):
+        """
+        Writes the summary to the file, as CSV if path ends with .csv,
+        as JSON otherwise.
+        :param path: str
+        :return: None
+        """
+        summary = self.summary()
+        with open(path, 'w', newline='') as file:
+            if path.endswith(".csv"):
+                writer = csv.writer(file)
+                writer.writerow(["phase", "mean", "p50", "p90", "p99"])
+                for name, values in summary.items():
+                    writer.writerow([name] + [f"{value:.3f}" for value in values.values()])
+            else:
+                json.dump({"frames": self._frames.count, "ms": summary}, file, indent=4)
+        return
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: scenes
+
+from packages.player.scenes.scene import Scene
+from packages.player.scenes.lobby import Lobby
+from packages.player.scenes.placement import Placement
+from packages.player.scenes.attack import Attack
+from packages.player.scenes.defend import Defend
+from packages.player.scenes.game_over import GameOver
+from packages.player.window import Window
+
+
+class Scenes(dict):
+
+    def __init__(self, battleship):
+        """
+        Constructor.
+        Scenes of the game, indexed by scene name.
+        Only the current scene gets the events and draws the frame,
+        scene itself picks the next one.
+        Drawing reads only what does not change during the frame,
+        so it does not need the commands lock, see Battleship.frame.
+        :param battleship: <class Battleship>
+        """
+        super().__init__()
+        self[Scene.LOBBY] = Lobby(battleship)
+        self[Scene.PLACEMENT] = Placement(battleship)
+        self[Scene.ATTACK] = Attack(battleship)
+        self[Scene.DEFEND] = Defend(battleship)
+        self[Scene.GAME_OVER] = GameOver(battleship)
+        self._current = None
+
+    @property
+    def current(self):
+        """
+        Getter.
+        :return: <class Scene>
+        """
+        return self._current
+
+    def switch(self, name):
+        """
+        Makes the named scene the current one.
+        :param name: str
+        :return: None
+        """
+        self._current = self[name]
+        self._current.enter()
+        return
+
+    def update(self, events):
+        """
+        Current scene handles the events and updates the game stats.
+        If scene is done, the next one becomes the current one.
+        :param events: list
+        :return: None
+        """
+        Window.PROFILER.begin("events")
+        name = self._current.update(events)
+        if name is not None:
+            self.switch(name)
+        Window.PROFILER.end("events")
+        return
+
+    def draw(self):
+        """
+        Current scene draws the frame.
+        :return: None
+        """
+        self._current.draw()
+        return
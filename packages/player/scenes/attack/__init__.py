@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: attack
+
+import time
+from packages.player.scenes.scene import Scene
+from packages.player.window import Window
+from packages.public.constants import Constants
+
+
+class Attack(Scene):
+
+    def __init__(self, battleship):
+        """
+        Constructor. Extends the Scene class.
+        Player picks the box of the opponent's grid
+        which he want's to attack.
+        :param battleship: <class Battleship>
+        """
+        super().__init__(battleship)
+        self._highlighted_box = None
+
+    def enter(self):
+        """
+        Starts the attack.
+        :return: None
+        """
+        self._highlighted_box = None
+        self._window.message = "ATTACK!!!"
+        return
+
+    def update(self, events):
+        """
+        Highlights the box under the mouse, strikes it on click.
+        Then player waits for the result and the opponent's attack.
+        :param events: list
+        :return: str
+        """
+        if self._player.game_over is not None:
+            return Scene.GAME_OVER
+        mousex, mousey, mouse_clicked = Scene._read_mouse(events)
+        movement = mousex != 0 and mousey != 0
+        covered_box, self._highlighted_box = Scene._on_mouse_motion(movement=movement, mousex=mousex, mousey=mousey,
+                                                                    highlighted_box=self._highlighted_box,
+                                                                    grid_=self._player.opponent_grid)
+        if mouse_clicked and self._highlighted_box is not None and self._highlighted_box not in self._player.strikes:
+            self._player.strike(box_=self._highlighted_box)
+            Window.PROFILER.sample("click to send", 1e3 * (time.perf_counter() - self._window.events_time))
+            self._highlighted_box = None
+            return Scene.DEFEND
+        return None
+
+    def draw(self):
+        """
+        Draws the game screen with the highlighted box.
+        :return: None
+        """
+        if self._highlighted_box and self._highlighted_box not in self._player.strikes:
+            self._window.highlight(boxes=[self._highlighted_box], color=Constants.RED)
+        self._window.show_game_screen(player=self._player)
+        return
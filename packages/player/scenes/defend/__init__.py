@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: defend
+
+from packages.player.scenes.scene import Scene
+
+
+class Defend(Scene):
+
+    def __init__(self, battleship):
+        """
+        Constructor. Extends the Scene class.
+        Opponent is on the move: he is completing his fleet
+        or attacking. Player only watches the game screen.
+        :param battleship: <class Battleship>
+        """
+        super().__init__(battleship)
+
+    def update(self, events):
+        """
+        Player attacks when server sends "-strike;".
+        :param events: list
+        :return: str
+        """
+        if self._player.game_over is not None:
+            return Scene.GAME_OVER
+        if self._player.attack:
+            return Scene.ATTACK
+        return None
+
+    def draw(self):
+        """
+        Draws the game screen.
+        :return: None
+        """
+        self._window.show_game_screen(player=self._player)
+        return
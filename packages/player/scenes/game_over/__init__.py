@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: game_over
+
+import pygame
+from packages.player.scenes.scene import Scene
+from packages.public.constants import Constants
+
+
+class GameOver(Scene):
+
+    def __init__(self, battleship):
+        """
+        Constructor. Extends the Scene class.
+        Game over cover on top of the game screen, then the game
+        over screen until the server starts a new game.
+        :param battleship: <class Battleship>
+        """
+        super().__init__(battleship)
+        self._until = 0     # ms, when the cover is replaced with the game over screen
+        self._drawn = None  # True if the cover is shown, False for the game over screen
+        self._won = False   # new game can start before the game over screen is shown, so result is kept
+
+    def enter(self):
+        """
+        Shows the game over cover.
+        Player stays for the next game, it is paired meanwhile.
+        :return: None
+        """
+        self._until = pygame.time.get_ticks() + 1000 * Constants.GAME_OVER_SLEEP_TIME
+        self._drawn = None
+        self._won = self._player.take_game_over()
+        if self._player.connected:
+            self._commands.stay()
+        return
+
+    def update(self, events):
+        """
+        New game starts when command check receives "-game;" message from the server.
+        If the connection is lost, lobby shows the connection failed screen.
+        :param events: list
+        :return: str
+        """
+        if pygame.time.get_ticks() < self._until:
+            return None
+        if self._player.in_game or self._player.game_over is not None:     # next game has started, maybe ended too
+            return Scene.PLACEMENT
+        if not self._player.connected:
+            return Scene.LOBBY
+        return None
+
+    def draw(self):
+        """
+        Draws the cover or the game over screen, only when it changes.
+        :return: None
+        """
+        cover = pygame.time.get_ticks() < self._until
+        if self._drawn == cover:
+            return
+        if cover:
+            self._window.show_game_screen(player=self._player)
+            self._window.show_game_over_screen_alpha(win=self._won)
+        else:
+            self._window.clear()
+            self._window.show_game_over_screen(win=self._won)
+        self._drawn = cover
+        return
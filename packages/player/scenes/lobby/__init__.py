@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: lobby
+
+import pygame
+from packages.player.scenes.scene import Scene
+from packages.public.constants import Constants
+
+
+class Lobby(Scene):
+    # lobby screens
+    WELCOME = "welcome"
+    CONNECTION_FAILED = "connection failed"
+    WAITING = "waiting"
+
+    def __init__(self, battleship):
+        """
+        Constructor. Extends the Scene class.
+        Welcome screen, then waiting for another player,
+        or connection failed screen and the game closes,
+        also when the connection is lost later.
+        :param battleship: <class Battleship>
+        """
+        super().__init__(battleship)
+        self._screen = None     # lobby screen that should be shown
+        self._drawn = None      # lobby screen that is shown
+        self._until = 0     # ms, when the current screen is done
+
+    def enter(self):
+        """
+        Shows the welcome screen, or connection failed screen
+        if the connection with the server was lost during the game.
+        :return: None
+        """
+        if self._screen is None or self._player.connected:
+            self._show(screen=Lobby.WELCOME, time=Constants.WELCOME_SCREEN_SLEEP_TIME)
+        else:
+            self._show(screen=Lobby.CONNECTION_FAILED, time=Constants.CONNECTION_FAILED_SLEEP_TIME)
+        return
+
+    def update(self, events):
+        """
+        Changes the lobby screen when its time is up.
+        Game starts when command check receives "-game;" message from the server.
+        :param events: list
+        :return: str
+        """
+        done = pygame.time.get_ticks() >= self._until
+        if self._screen == Lobby.WELCOME and done:
+            if self._player.connected:
+                self._show(screen=Lobby.WAITING)
+            else:   # Connecting with the server failed!
+                self._show(screen=Lobby.CONNECTION_FAILED, time=Constants.CONNECTION_FAILED_SLEEP_TIME)
+        elif self._screen == Lobby.CONNECTION_FAILED and done:
+            self._battleship.terminate()    # closes the game automatically
+        elif self._screen == Lobby.WAITING and not self._player.connected:     # connection is lost
+            self._show(screen=Lobby.CONNECTION_FAILED, time=Constants.CONNECTION_FAILED_SLEEP_TIME)
+        elif self._screen == Lobby.WAITING and (self._player.in_game or self._player.game_over is not None):
+            return Scene.PLACEMENT
+        return None
+
+    def draw(self):
+        """
+        Draws the lobby screen, only when it changes.
+        :return: None
+        """
+        if self._drawn == self._screen:
+            return
+        self._window.clear()
+        if self._screen == Lobby.WELCOME:
+            self._window.show_welcome_screen()
+        elif self._screen == Lobby.CONNECTION_FAILED:
+            self._window.show_connection_failed_screen()
+        else:
+            self._window.show_waiting_for_player_screen()
+        self._drawn = self._screen
+        return
+
+    def _show(self, screen, time=0):
+        """
+        Sets the lobby screen, shown for at least time seconds.
+        :param screen: str
+        :param time: int
+        :return: None
+        """
+        self._screen = screen
+        self._until = pygame.time.get_ticks() + 1000 * time
+        return
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: placement
+
+import random
+from pygame.locals import *
+from packages.core.placements import Placements
+from packages.player.scenes.scene import Scene
+from packages.player.shape import Shape
+from packages.public.constants import Constants
+
+
+class Placement(Scene):
+    # keys that change the orientation of the shape
+    DIRECTION_KEYS = {K_LEFT: Constants.DIR_LEFT, K_RIGHT: Constants.DIR_RIGHT,
+                      K_UP: Constants.DIR_UP, K_DOWN: Constants.DIR_DOWN}
+
+    def __init__(self, battleship):
+        """
+        Constructor. Extends the Scene class.
+        Player creates his fleet, boat by boat,
+        then informs the server that he is ready.
+        :param battleship: <class Battleship>
+        """
+        super().__init__(battleship)
+        self._boat_order = _get_all_boats_sizes()
+        self._created_boats = 0
+        self._direction = Constants.DIR_RIGHT
+        self._highlighted_box = None
+        self._highlighted_shape = None
+        self._placements = None
+
+    @property
+    def boat_size(self):
+        """
+        Getter. Returns the size of the next boat.
+        :return: int
+        """
+        return self._boat_order[min(self._created_boats, len(self._boat_order) - 1)]
+
+    def enter(self):
+        """
+        Starts creating the fleet on the empty board.
+        :return: None
+        """
+        self._created_boats = 0
+        self._direction = Constants.DIR_RIGHT
+        self._highlighted_box = None
+        self._highlighted_shape = None
+        self._placements = Placements(board=self._player.board)
+        self._window.message = "Use ARROWS to rotate the shape. Press ENTER to create a boat, A to place the rest."
+        return
+
+    def update(self, events):
+        """
+        Moves and rotates the shape, creates the boats.
+        When the fleet is complete, player is ready for the start of the game.
+        :param events: list
+        :return: str
+        """
+        if self._player.game_over is not None:
+            return Scene.GAME_OVER
+        mousex, mousey, mouse_clicked = Scene._read_mouse(events)
+        movement = mousex != 0 and mousey != 0
+        key_pressed = False
+        create_boat = False
+        auto_place = False
+        for event in events:
+            if event.type != KEYDOWN:
+                continue
+            if event.key in Placement.DIRECTION_KEYS:
+                self._direction = Placement.DIRECTION_KEYS[event.key]
+                key_pressed = True
+            elif event.key == K_RETURN:
+                create_boat = True
+            elif event.key == K_a:
+                auto_place = True
+
+        # update the game stats
+        covered_box, self._highlighted_box = Scene._on_mouse_motion(movement=movement, mousex=mousex, mousey=mousey,
+                                                                    highlighted_box=self._highlighted_box,
+                                                                    grid_=self._player.his_grid)
+
+        # create shape, only when mouse moves to another box
+        if self._highlighted_box is None:
+            self._highlighted_shape = None
+        elif self._highlighted_shape is None or self._highlighted_shape.head is not self._highlighted_box:
+            self._highlighted_shape = Shape(grid=self._player.his_grid, placements=self._placements,
+                                            head=self._highlighted_box, size=self.boat_size,
+                                            direction=self._direction)
+        elif key_pressed:   # player changed the orientation of the shape
+            self._highlighted_shape.change_orientation(direction=self._direction)
+
+        # create a boat
+        if create_boat:     # player can press ENTER without marking the shape
+            if self._highlighted_shape and self._highlighted_shape.is_valid:
+                self._player.create_boat(placements=self._placements, shape=self._highlighted_shape)
+                self._created_boats += 1
+                self._highlighted_shape = None
+                self._highlighted_box = None
+
+        # place the rest of the fleet
+        if auto_place:
+            rest = self._boat_order[self._created_boats:]
+            for i, j, size, direction in self._placements.complete(rest, random.Random()) or []:
+                self._player.create_boat(placements=self._placements,
+                                         shape=Shape(grid=self._player.his_grid, placements=self._placements,
+                                                     head=self._player.his_grid[i][j], size=size,
+                                                     direction=direction))
+                self._created_boats += 1
+            self._highlighted_shape = None
+            self._highlighted_box = None
+
+        if self._created_boats == len(self._boat_order):
+            # inform server that player is ready for the start of the game
+            self._commands.ready("fleet")
+            self._window.message = "Waiting for other player to complete his fleet..."
+            return Scene.DEFEND
+        return None
+
+    def draw(self):
+        """
+        Draws the game screen with the shape and
+        the next boat highlighted in the fleet table.
+        :return: None
+        """
+        if self._highlighted_shape:
+            color = {True: Constants.BLUE, False: Constants.RED}[self._highlighted_shape.is_valid]
+            self._window.highlight(boxes=self._highlighted_shape.get, color=color)
+        self._window.highlight_row(index=Constants.BOAT_SIZES.index(self.boat_size) + 2, color=Constants.GREEN)
+        self._window.show_game_screen(player=self._player)
+        return
+
+
+def _get_all_boats_sizes():
+    """
+    Function returns a list dimension of total number of boats that needs to be created.
+    Each element is size of that boat.
+    :return: list
+    """
+    list_ = []
+    for i in range(len(Constants.BOAT_NAMES)):
+        list_ += [Constants.BOAT_SIZES[i]] * Constants.BOAT_QUANTITY[i]
+    return list_
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: scene
+
+from pygame.locals import *
+from packages.public.constants import Constants
+
+
+class Scene(object):
+    # scene names
+    LOBBY = "lobby"
+    PLACEMENT = "placement"
+    ATTACK = "attack"
+    DEFEND = "defend"
+    GAME_OVER = "game over"
+
+    def __init__(self, battleship):
+        """
+        Constructor.
+        Scene is one part of the game (lobby, fleet placement, attack...)
+        with its own input and screen. It has no loop of its own,
+        the main loop calls it once per frame, see Scenes.frame.
+        :param battleship: <class Battleship>
+        """
+        self._window = battleship.window
+        self._player = battleship.player
+        self._commands = battleship.commands
+        self._battleship = battleship
+
+    def enter(self):
+        """
+        Called when scene becomes the current one.
+        :return: None
+        """
+        return
+
+    def update(self, events):
+        """
+        Handles the events of this frame and updates the game stats.
+        Returns the name of the next scene, None to stay in this one.
+        :param events: list
+        :return: str
+        """
+        return None
+
+    def draw(self):
+        """
+        Draws the frame, only what has changed is drawn.
+        :return: None
+        """
+        return
+
+    @staticmethod
+    def _read_mouse(events):
+        """
+        Reads mouse events of this frame.
+        Returns mousex, mousey, clicked.
+        :param events: list
+        :return: tuple
+        """
+        clicked = False
+        mousex, mousey = (0, 0)     # if no movement had happend
+        for event in events:
+            if event.type == MOUSEMOTION:
+                mousex, mousey = event.pos
+            elif event.type == MOUSEBUTTONUP:
+                mousex, mousey = event.pos
+                clicked = True
+        return mousex, mousey, clicked
+
+    @staticmethod
+    def _on_mouse_motion(movement, mousex, mousey, highlighted_box, grid_):
+        """
+        Handles the mouse motion event.
+        Updates the game stats.
+        Returns currently covered box as well as
+        the box that should be highlighted.
+        :param movement: bool
+        :param mousex: int
+        :param mousey: int
+        :param highlighted_box: <class Box>
+        :param grid_: <class Grid>
+        :return: tuple :: (<class Box>, <class Box>)
+        """
+        if movement:  # if mouse has been moved
+            covered_box = grid_.get_box_at_pixel(mousex, mousey)
+            if covered_box:     # mouse over the grid's box
+                if covered_box != highlighted_box and covered_box.type == Constants.EMPTY:
+                    # in order to highlight the box, it needs to be empty and not already highlighted
+                    highlighted_box = covered_box
+                elif covered_box.type != Constants.EMPTY:
+                    # already selected box, we do not have any highlighted box
+                    highlighted_box = None
+            else:   # mouse is not over the grid's box
+                if not grid_.area.collidepoint(mousex, mousey):
+                    highlighted_box = None
+        else:  # no mouse motion
+            covered_box = highlighted_box
+        return covered_box, highlighted_box
@@ -2,30 +2,34 @@
 # -*- coding: utf-8 -*-
 # package name: shape
 
-from packages.public.constants import Constants
 # from packages.public.logger import Logger
 
 
 class Shape(object):
 
-    def __init__(self, grid, head, size, direction):
+    def __init__(self, grid, placements, head, size, direction):
         """
         Constructor.
         Creates shape within given grid.
+        Placements index decides if the shape is valid,
+        grid only gives the boxes to draw.
         Box represends the head of the shape.
         Lenght is given with parameter size.
         Direction is defined with parameter direction.
         :param grid: <class Grid>
+        :param placements: <class Placements>
         :param head: <class Box>
         :param size: int
         :param direction: str
         """
         self._grid = grid
+        self._placements = placements
         self._head = head     # we can assume that this box is not selected (that is, empty)
         self._size = size
         self._direction = direction
         # assert self._direction in [Shape.LEFT, Shape.RIGHT, Shape.UP, Shape.DOWN], "Invalid direction!"
         self._shape = list()
+        self._cells = list()    # (i, j) of each box
 
         # creates the shape
         self._valid = self._create()
@@ -46,6 +50,23 @@ class Shape(object):
         """
         return self._size
 
+    @property
+    def direction(self):
+        """
+        Getter.
+        :return: str
+        """
+        return self._direction
+
+    @property
+    def placement(self):
+        """
+        Getter. Returns (i, j, size, direction) of the shape.
+        :return: tuple
+        """
+        i, j = self._head.cell
+        return i, j, self._size, self._direction
+
     @property
     def is_valid(self):
         """
@@ -62,39 +83,25 @@ class Shape(object):
         """
         return self._shape
 
+    @property
+    def cells(self):
+        """
+        Getter. Returns (i, j) of each box.
+        :return: list
+        """
+        return self._cells
+
     def _create(self):
         """
         Creates the shape, if possible of course.
+        Shape stops at the grid border.
         Returns True if shape can be created, False otherwise.
         :return: bool
         """
-        valid = True
-        self._shape.append(self._head)
-        # Shorter temp variable names
-        x = self._head.x
-        y = self._head.y
-        width = self._head.width + Constants.SEPARATOR_WIDTH
-        while len(self._shape) < self._size:
-            try:
-                if self._direction == Constants.DIR_LEFT:
-                    box = self._grid.get_box_at_pixel(x=x - width * len(self._shape), y=y)
-                elif self._direction == Constants.DIR_RIGHT:
-                    box = self._grid.get_box_at_pixel(x=x + width * len(self._shape), y=y)
-                elif self._direction == Constants.DIR_UP:
-                    box = self._grid.get_box_at_pixel(x=x, y=y - width * len(self._shape))
-                else:
-                    box = self._grid.get_box_at_pixel(x=x, y=y + width * len(self._shape))
-            except IndexError:  # too close to the grid border
-                valid = False
-                return valid
-            else:
-                if box is None:     # box will be None if it is out of the grid sizes
-                    valid = False
-                    return valid
-                elif box.type != Constants.EMPTY:
-                    valid = False
-                self._shape.append(box)
-        return valid
+        i, j = self._head.cell
+        self._cells = self._placements.cells(i=i, j=j, size=self._size, direction=self._direction)
+        self._shape = [self._grid[i_][j_] for i_, j_ in self._cells]
+        return self._placements.is_legal(i=i, j=j, size=self._size, direction=self._direction)
 
     def change_orientation(self, direction):
         """
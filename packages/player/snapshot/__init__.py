@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: snapshot
+
+
+class Snapshot(object):
+
+    def __init__(self):
+        """
+        Constructor.
+        Double-buffered state of the boxes for the renderer,
+        {<class Box>: (kind, color, highlight color)}, see Window.show_game_screen.
+        Game logic builds the new state aside (back buffer) and
+        publishes it with a single assignment, so the renderer always
+        reads a whole state, even when messages are handled on
+        the trace thread. Published state is never changed.
+        """
+        self._front = dict()
+        self._version = 0   # incremented on each publish
+
+    @property
+    def front(self):
+        """
+        Getter. Returns the last published state.
+        :return: dict
+        """
+        return self._front
+
+    @property
+    def version(self):
+        """
+        Getter.
+        :return: int
+        """
+        return self._version
+
+    def publish(self, back):
+        """
+        Publishes the new state, it must not be changed afterwards.
+        :param back: dict
+        :return: None
+        """
+        self._front = back
+        self._version += 1
+        return
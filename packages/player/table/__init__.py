@@ -26,6 +26,8 @@ class Table(Area):
         self._table = list(list())  # matrix
         self._col_widest = list()   # remembers the widest string length that is stored in each column
         self._cols_left_coord = list()  # used for drawing the table
+        self._surface = None    # rendered table, created again only when the table changes
+        self._surface_rect = None   # where the rendered table goes on the screen
 
     def __str__(self):
         """
@@ -122,6 +124,7 @@ class Table(Area):
         :param args: tuple
         :return: bool
         """
+        cols = self._cols
         row = list()
         for i in range(len(args)):
             data = str(args[i])
@@ -135,22 +138,39 @@ class Table(Area):
             row.append(data)
         self._table.append(row)
         self._rows += 1
-        # check previous and new rows and their number of columns
-        for row in self._table[:self._rows]:
+        # check the number of columns, previous rows only if the new row has additional columns
+        for row in (self._table if self._cols > cols else self._table[-1:]):
             while len(row) < self._cols:
                 row.append(None)
+        self._surface = None
         return True
 
     def draw(self, surface):
         """
         Method draws the table.
-        Calculates it's own font sizes to fill the given space on screen.
+        Table is rendered only when it changes,
+        otherwise this is a single blit.
         :param surface: <class Surface>
         :return: None
         """
+        Window.PROFILER.begin("table")
+        if self._surface is None:
+            self._render()
+        surface.blit(self._surface, self._surface_rect)
+        Window.PROFILER.end("table")
+        return
+
+    def _layout(self):
+        """
+        Lays out the table.
+        Calculates it's own font sizes to fill the given space on screen.
+        Returns text surface and its position on the screen, for each cell.
+        :return: list :: [(<class Surface>, <class Rect>)]
+        """
         row_height = self.height // self._rows
         col_widths = list(map(lambda w: w / sum(self._col_widest) * self.width, self._col_widest))
         font_size = row_height - 2 * self._row_margin  # TODO: this 20 replace with some formula!
+        cells = []
         x = self.x + self.margin
         y = self.y + self.margin
         for row in range(self._rows):
@@ -165,10 +185,24 @@ class Table(Area):
                             break
                         tmp_font_size -= 2 * self._row_margin
                     rect.topleft = (x, y)
-                    surface.blit(surf, rect)
+                    cells.append((surf, rect))
                 x += col_widths[col]
             x = self.x + self._margin
             y += row_height + self._row_margin
+        return cells
+
+    def _render(self):
+        """
+        Renders the table into an off-screen surface,
+        big enough for the table area and all of its text.
+        :return: None
+        """
+        cells = self._layout()
+        self._surface_rect = pygame.Rect(self.area).unionall([rect for _, rect in cells])
+        self._surface = pygame.Surface(self._surface_rect.size)
+        self._surface.fill(Constants.BGCOLOR)
+        for surf, rect in cells:
+            self._surface.blit(surf, rect.move(-self._surface_rect.x, -self._surface_rect.y))
         return
 
     def highlight_row(self, surface, index, color):
@@ -184,8 +218,16 @@ class Table(Area):
             return False
 
         highlight_width = int(self._row_margin * 0.5)
+        pygame.draw.rect(surface, color, self.row_rect(index), highlight_width)
+        return True
+
+    def row_rect(self, index):
+        """
+        Returns the rectangle of the row highlight.
+        :param index: int
+        :return: <class Rect>
+        """
         row_height = self.height // self._rows
         x = self.x + self.margin - self._row_margin
         y = self.y + self.margin - self._row_margin // 2 + (row_height + self._row_margin) * index
-        pygame.draw.rect(surface, color, pygame.Rect(x, y, self.width, row_height), highlight_width)
-        return True
+        return pygame.Rect(x, y, self.width, row_height)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: text_cache
+
+import pygame
+from collections import OrderedDict
+
+
+class TextCache(object):
+
+    def __init__(self, limit):
+        """
+        Constructor.
+        Cache of fonts and rendered text surfaces.
+        Fonts are kept by (name, size), font file is read only once.
+        Surfaces are kept by (name, size, text, fg, bg), least recently
+        used ones are dropped when they take more than limit bytes.
+        Cached surfaces are shared, so they must not be drawn on.
+        :param limit: int
+        """
+        self._limit = limit
+        self._fonts = dict()
+        self._surfaces = OrderedDict()
+        self._bytes = 0     # memory taken by cached surfaces
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def limit(self):
+        """
+        Getter.
+        :return: int
+        """
+        return self._limit
+
+    @property
+    def bytes(self):
+        """
+        Getter.
+        :return: int
+        """
+        return self._bytes
+
+    @property
+    def hits(self):
+        """
+        Getter.
+        :return: int
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Getter.
+        :return: int
+        """
+        return self._misses
+
+    @property
+    def evictions(self):
+        """
+        Getter.
+        :return: int
+        """
+        return self._evictions
+
+    def __len__(self):
+        """
+        Returns the number of cached surfaces.
+        :return: int
+        """
+        return len(self._surfaces)
+
+    def font(self, name, size):
+        """
+        Returns the font, loads it only the first time.
+        :param name: str
+        :param size: int
+        :return: <class Font>
+        """
+        font = self._fonts.get((name, size))
+        if font is None:
+            font = self._fonts[(name, size)] = pygame.font.Font(name, size)
+        return font
+
+    def render(self, name, size, text, fg, bg=None):
+        """
+        Returns the surface with rendered text.
+        :param name: str
+        :param size: int
+        :param text: str
+        :param fg: tuple
+        :param bg: tuple
+        :return: <class Surface>
+        """
+        key = (name, size, text, fg, bg)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self._hits += 1
+            return surf
+        self._misses += 1
+        surf = self.font(name, size).render(text, True, fg, bg)
+        self._surfaces[key] = surf
+        self._bytes += TextCache._size_of(surf)
+        while self._bytes > self._limit and len(self._surfaces) > 1:
+            _, evicted = self._surfaces.popitem(last=False)
+            self._bytes -= TextCache._size_of(evicted)
+            self._evictions += 1
+        return surf
+
+    def clear(self):
+        """
+        Drops all cached surfaces, fonts are kept.
+        :return: None
+        """
+        self._surfaces.clear()
+        self._bytes = 0
+        return
+
+    @staticmethod
+    def _size_of(surf):
+        """
+        Returns memory taken by the surface pixels.
+        :param surf: <class Surface>
+        :return: int
+        """
+        return surf.get_pitch() * surf.get_height()
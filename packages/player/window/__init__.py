@@ -2,12 +2,26 @@
 # -*- coding: utf-8 -*-
 # package name: window
 
+import time
 import pygame
+from packages.player.profiler import Profiler
+from packages.player.text_cache import TextCache
 from packages.public.constants import Constants
 
 
 class Window(object):
 
+    FPS_CLOCK = pygame.time.Clock()
+    TEXT_CACHE = TextCache(limit=Constants.TEXT_CACHE_BYTES)
+    PROFILER = Profiler(size=Constants.PROFILER_SIZE)
+    INBOX_EVENT = pygame.event.custom_type()    # posted when a message comes from the server
+    INPUT_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP)
+    EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+    # kinds of box states on the game screen
+    CELL_FILL = "fill"
+    CELL_HIT = "hit"
+    CELL_MISS = "miss"
+
     def __init__(self, caption, width, height, margin):
         """
         Constructor. Width and height are parameters for window size.
@@ -26,6 +40,24 @@ class Window(object):
 
         self._message = ""
 
+        # retained game screen, see show_game_screen
+        self._scene = None  # <class Player> whose game screen is on the display, None for any other screen
+        self._dirty = None  # rectangles to update, None for the whole screen
+        self._cells = dict()    # {<class Box>: state} of boxes drawn on the game screen
+        self._drawn_cells = None    # (snapshot version, highlights) the boxes are drawn for
+        self._drawn_message = None  # (text, <class Rect>) of the message drawn on the game screen
+        self._drawn_row = None  # (index, color) of the fleet table row drawn as highlighted
+        self._highlights = dict()   # {<class Box>: color} boxes to highlight in the next frame
+        self._row_highlight = None  # (index, color) of the fleet table row to highlight in the next frame
+        self._background = None     # <class Surface>, static part of the game screen
+        self._background_key = None     # what the background was drawn for, see _get_background
+        self._last_active = 0   # ms, last time something was updated on the screen or player gave any input
+        self._next_frame = 0    # ms, when the next frame is due
+        self._woken = None  # perf_counter time of the input that woke the window
+        self._busy = time.perf_counter()   # perf_counter time since unread input may have come
+        self._events_time = None    # perf_counter time when the last read input came
+        self._input_time = None     # perf_counter time of the oldest input not shown yet
+
         # init the window
         pygame.init()
         self._display_surf = pygame.display.set_mode((self._width, self._height))    # constant, display surface for our window
@@ -90,6 +122,44 @@ class Window(object):
         self._message = value
         return
 
+    @property
+    def events_time(self):
+        """
+        Getter. Returns perf_counter time when the input
+        read by the last get_events came, None if there was no input.
+        :return: float
+        """
+        return self._events_time
+
+    @property
+    def frame_due(self):
+        """
+        Getter. Returns True if it is time to draw the next frame.
+        :return: bool
+        """
+        return pygame.time.get_ticks() >= self._next_frame
+
+    def highlight(self, boxes, color):
+        """
+        Highlights the boxes in the next frame of the game screen.
+        :param boxes: list
+        :param color: tuple
+        :return: None
+        """
+        for box_ in boxes:
+            self._highlights[box_] = color
+        return
+
+    def highlight_row(self, index, color):
+        """
+        Highlights the fleet table row in the next frame of the game screen.
+        :param index: int
+        :param color: tuple
+        :return: None
+        """
+        self._row_highlight = (index, color)
+        return
+
     def show_welcome_screen(self, animation=False):
         """
         Sets the welcome screen as currently displayed screen.
@@ -132,20 +202,84 @@ class Window(object):
         """
         Sets the game screen as currently displayed screen.
         This happens when player joins the game.
+        Screen is drawn whole only the first time. After that,
+        only boxes, message and table row that changed since
+        the last frame are drawn, and only they are updated.
         :param player: <class Player>
         :param animation: bool
         :return: None
         """
         if animation:
             pass
-        self.clear()    # refresh the screen (that is, clear) so we can see changes
+        Window.PROFILER.begin("game screen")
+        if self._scene is not player:
+            self._draw_game_screen(player=player)
+            self._scene = player
+            self._cells = dict()
+            self._drawn_cells = None
+            self._drawn_message = None
+            self._drawn_row = None
+        self._update_message(player=player)
+        self._update_row(player=player)
+        self._update_cells(player=player)
+        self._highlights = dict()
+        self._row_highlight = None
+        Window.PROFILER.end("game screen")
+        return
+
+    def _draw_game_screen(self, player):
+        """
+        Draws the parts of the game screen that do not change.
+        :param player: <class Player>
+        :return: None
+        """
+        self._invalidate()
+        self.DISPLAYSURF.blit(self._get_background(player=player), (0, 0))
+
+        # draw table
+        player.fleet_table.draw(surface=self.DISPLAYSURF)
+        return
+
+    def _get_background(self, player):
+        """
+        Returns the background of the game screen: title, grid names and grids.
+        Background is drawn only once, and again only if the window
+        size, background color or grids have changed.
+        :param player: <class Player>
+        :return: <class Surface>
+        """
+        key = (self.DISPLAYSURF.get_size(), Constants.BGCOLOR,
+               tuple(player.his_grid.area), tuple(player.opponent_grid.area))
+        if self._background is None or key != self._background_key:
+            self._background = pygame.Surface(self.DISPLAYSURF.get_size()).convert()
+            self._draw_background(surface=self._background, player=player)
+            self._background_key = key
+        return self._background
+
+    def invalidate_background(self):
+        """
+        Background is drawn again, the next time game screen is drawn whole.
+        :return: None
+        """
+        self._background = None
+        self._invalidate()
+        return
+
+    def _draw_background(self, surface, player):
+        """
+        Draws the background of the game screen on the surface.
+        :param surface: <class Surface>
+        :param player: <class Player>
+        :return: None
+        """
+        surface.fill(Constants.BGCOLOR)
 
         # show title
         font_size = self._margin * 0.9
         surf, rect = self.create_text(font_name=Constants.FONT_NAME_1, font_size=int(font_size), text=self._caption,
                                       fg=Constants.BLACK, bg=Constants.BGCOLOR)
         rect.midtop = (self._width // 2, (self._margin - font_size) // 2)
-        self.DISPLAYSURF.blit(surf, rect)
+        surface.blit(surf, rect)
 
         # show grid names
         font_size = self._margin * 0.25
@@ -156,33 +290,108 @@ class Window(object):
             surf, rect = self.create_text(font_name=Constants.FONT_NAME_1, font_size=int(font_size), text=name,
                                           fg=color, bg=Constants.BGCOLOR)
             rect.midbottom = (x, y)
-            self.DISPLAYSURF.blit(surf, rect)
+            surface.blit(surf, rect)
 
         # draw grids
-        player.his_grid.draw(surface=self.DISPLAYSURF, color1=Constants.BLACK, color2=Constants.BLUE, color3=Constants.GREY)
-        player.opponent_grid.draw(surface=self.DISPLAYSURF, color1=Constants.BLACK, color2=Constants.RED, color3=Constants.GREY)
-
-        # draw table
-        player.fleet_table.draw(surface=self.DISPLAYSURF)
+        player.his_grid.draw(surface=surface, color1=Constants.BLACK, color2=Constants.BLUE, color3=Constants.GREY)
+        player.opponent_grid.draw(surface=surface, color1=Constants.BLACK, color2=Constants.RED, color3=Constants.GREY)
+        return
 
-        # show message
+    def _update_message(self, player):
+        """
+        Draws the message, if it has changed.
+        :param player: <class Player>
+        :return: None
+        """
+        if self._drawn_message is not None and self._drawn_message[0] == self._message:
+            return
+        if self._drawn_message is not None:     # erase the old one
+            self._erase(self._drawn_message[1])
+            self._mark_dirty(self._drawn_message[1])
         font_size = self._margin * 0.2
         surf, rect = self.create_text(font_name=Constants.FONT_NAME_1, font_size=int(font_size), text=self._message,
                                       fg=Constants.GREY, bg=Constants.BGCOLOR)
         # rect.midbottom = (self._width // 2, self._height - (self._margin - font_size) // 2)
         rect.midbottom = (player.opponent_grid.area.midbottom[0], self._height - (self._margin - font_size) // 2)
         self.DISPLAYSURF.blit(surf, rect)
+        self._mark_dirty(rect)
+        self._drawn_message = (self._message, rect)
+        return
 
-        # --- Changeable elements ---
-        # redraw boats - the players' ones
-        for boat_ in player.boats:  # this will update existing boats, and created newly ones
-            boat_.draw(self.DISPLAYSURF)
-        # redraw strikes - the opponents' grid
-        for box_ in player.strikes:
-            if box_.is_hit:  # hit
-                box_.reveal(self.DISPLAYSURF)
-            else:  # miss
-                box_.miss(self.DISPLAYSURF)
+    def _update_row(self, player):
+        """
+        Draws the highlighted fleet table row, if it has changed.
+        :param player: <class Player>
+        :return: None
+        """
+        if self._row_highlight == self._drawn_row:
+            return
+        table = player.fleet_table
+        if self._drawn_row is not None:     # erase the old highlight, table covers it again
+            rect = table.row_rect(self._drawn_row[0])
+            self._erase(rect)
+            table.draw(surface=self.DISPLAYSURF)
+            self._mark_dirty(rect)
+        if self._row_highlight is not None:
+            index, color = self._row_highlight
+            if table.highlight_row(surface=self.DISPLAYSURF, index=index, color=color):
+                self._mark_dirty(table.row_rect(index))
+        self._drawn_row = self._row_highlight
+        return
+
+    def _update_cells(self, player):
+        """
+        Draws the boxes of both grids whose state has changed.
+        State of the boxes is read from the player's snapshot,
+        nothing else of the game is read while drawing.
+        :param player: <class Player>
+        :return: None
+        """
+        drawn = (player.snapshot.version, self._highlights)
+        if drawn == self._drawn_cells:  # nothing has changed
+            return
+        cells = dict(player.snapshot.front)
+        for box_, color in self._highlights.items():
+            kind, fill, _ = cells.get(box_, (None, None, None))
+            cells[box_] = (kind, fill, color)
+
+        for box_ in set(cells) | set(self._cells):
+            state = cells.get(box_)
+            if state != self._cells.get(box_):
+                self._draw_cell(box_=box_, state=state)
+        self._cells = cells
+        self._drawn_cells = drawn
+        return
+
+    def _draw_cell(self, box_, state):
+        """
+        Draws the box in given state.
+        :param box_: <class Box>
+        :param state: tuple or None
+        :return: None
+        """
+        box_.draw(self.DISPLAYSURF, state)
+        self._mark_dirty(box_.area)
+        return
+
+    def _erase(self, rect):
+        """
+        Restores the background of the game screen in the rectangle.
+        :param rect: <class Rect>
+        :return: None
+        """
+        self.DISPLAYSURF.blit(self._background, rect, rect)
+        return
+
+    def _mark_dirty(self, rect):
+        """
+        Adds the rectangle to the next update.
+        Nothing to add if whole screen will be updated.
+        :param rect: <class Rect>
+        :return: None
+        """
+        if self._dirty is not None:
+            self._dirty.append(pygame.Rect(rect))
         return
 
     def show_game_over_screen(self, win, animation=False):
@@ -222,6 +431,7 @@ class Window(object):
             caption = "YOU LOST!"
             bgcolor = Constants.RED + (alpha_value, )
 
+        self._invalidate()
         transparent_surface = pygame.Surface((self._width, self._height))
         transparent_surface = transparent_surface.convert_alpha()
         transparent_surface.fill(bgcolor)
@@ -244,6 +454,7 @@ class Window(object):
         :param message: str
         :return: None
         """
+        self._invalidate()
         caption_surf, caption_rect = Window.create_text(Constants.FONT_NAME_1, Constants.FONT_SIZE_1,
                                                         caption, Constants.BLACK, Constants.WHITE)
         caption_rect.midtop = (self._width / 2, self._height / 4)
@@ -262,6 +473,7 @@ class Window(object):
         Private method, just to better organize our code, as we will
         need to create a text many times.
         Method returns text surface and text rectangle.
+        Surface comes from the text cache, so it must not be drawn on.
         :param font_name: str
         :param font_size: int
         :param text: str
@@ -269,47 +481,176 @@ class Window(object):
         :param bg: str
         :return: tuple :: (<class Surface>, <class Rect>)
         """
-        font = pygame.font.Font(font_name, font_size)
-        surf = font.render(text, True, fg, bg)
+        surf = Window.TEXT_CACHE.render(font_name, font_size, text, fg, bg)
         rect = surf.get_rect()
         return surf, rect
 
-    def freeze(self, time, func):
+    def get_events(self):
         """
-        Freezes the currently displayed screen for a given time (seconds).
-        Method needs to perform given function during the freeze,
-        so we will not just pause the program on given time,
-        instead there is a for loop which ensures enough function
-        calls. In our example, we will need to check if user wants
-        to close the app during the freeze.
-        :param time: int
-        :param func: function
-        :return: None
+        Returns all events, main loop reads them once per loop.
+        Remembers when the input came: when it woke the window, or
+        if it came while the window was busy, when the window stopped
+        waiting, so its latency is never less than it really is.
+        :return: list
         """
-        number_of_iterations = time * Constants.FPS
-        for _ in range(number_of_iterations):
-            func()
-            self.update()
-        return
+        events = pygame.event.get()
+        self._events_time = None
+        if any(event.type in Window.INPUT_EVENTS for event in events):
+            self._events_time = self._woken or self._busy
+            if self._input_time is None:
+                self._input_time = self._events_time
+        self._woken = None
+        self._busy = time.perf_counter()
+        return events
 
-    def update(self, clear=False):
+    def update(self, clear=False, wait=True):
         """
         Updates the window screen.
         Syntatic sugar.
         If clear, window is filled with background color
         to delete any drawing that was before on it.
+        On the game screen, only dirty rectangles are updated.
+        Between frames, window waits for events instead of sleeping,
+        so the player's input or a message from the server (see notify_inbox)
+        starts the next frame right away, not after the whole frame.
+        When nothing has changed for a while, window is idle:
+        there is no next frame at full frame rate, only the wait for events.
+        If not wait, main loop waits by itself, see wait_input.
+        :param clear: bool
+        :param wait: bool
         :return: None
         """
         if clear:
             self.clear()
-        pygame.display.update()
-        Constants.FPS_CLOCK.tick(Constants.FPS)
+        if self._dirty is None or self._dirty:
+            self._last_active = pygame.time.get_ticks()
+        overlay = self._draw_profiler() if Window.PROFILER.overlay else None
+        Window.PROFILER.begin("display update")
+        if self._dirty is None:
+            pygame.display.update()
+        elif self._dirty:
+            pygame.display.update(self._dirty)
+        Window.PROFILER.end("display update")
+        if self._input_time is not None:    # input is handled and shown now
+            Window.PROFILER.sample("input to screen", 1e3 * (time.perf_counter() - self._input_time))
+            self._input_time = None
+        self._dirty = []
+        if overlay is not None:     # overlay is only on the display, restore what was under it
+            rect, under = overlay
+            self.DISPLAYSURF.blit(under, rect)
+            self._mark_dirty(rect)
+        if wait:
+            self.wait_input()
+            Window.PROFILER.begin("tick")
+            Window.FPS_CLOCK.tick(Constants.INPUT_FPS)
+            Window.PROFILER.end("tick")
+        self._next_frame = pygame.time.get_ticks() + 1000 / Constants.FPS
+        Window.PROFILER.frame()
         return
 
+    def wait_input(self):
+        """
+        Waits for the next frame, any event that comes before it
+        ends the wait. Idle window waits only for events,
+        at most Constants.IDLE_TIMEOUT seconds.
+        :return: None
+        """
+        if pygame.time.get_ticks() - self._last_active > 1000 * Constants.IDLE_AFTER:
+            Window.PROFILER.begin("idle")
+            self._wait(timeout=1000 * Constants.IDLE_TIMEOUT)
+            Window.PROFILER.end("idle")
+        else:
+            Window.PROFILER.begin("tick")
+            self._wait(timeout=self._next_frame - pygame.time.get_ticks())
+            Window.PROFILER.end("tick")
+        return
+
+    def _wait(self, timeout):
+        """
+        Waits for any event, at most timeout milliseconds.
+        Input is put back for the loop to handle it, and window
+        is active again. Exposed window is updated whole with the next update.
+        Other events are dropped, they only wake the window.
+        :param timeout: float
+        :return: None
+        """
+        if timeout < 1:     # 0 would wait forever
+            return
+        if pygame.event.peek(Window.INPUT_EVENTS):  # input came while window was busy, no waiting
+            self._last_active = pygame.time.get_ticks()
+            return
+        event = pygame.event.wait(int(timeout))
+        if event.type in Window.INPUT_EVENTS:
+            pygame.event.post(event)
+            self._last_active = pygame.time.get_ticks()
+            if self._woken is None:
+                self._woken = time.perf_counter()
+            return
+        self._busy = time.perf_counter()    # no input during the wait
+        if event.type in Window.EXPOSE_EVENTS:
+            self._dirty = None
+        return
+
+    @staticmethod
+    def notify_inbox():
+        """
+        Wakes the idle window, there is a message from the server.
+        Called from the trace thread.
+        :return: None
+        """
+        try:
+            pygame.event.post(pygame.event.Event(Window.INBOX_EVENT))
+        except pygame.error:    # window is already closed
+            pass
+        return
+
+    def toggle_profiler(self):
+        """
+        Shows or hides the profiler overlay.
+        :return: None
+        """
+        Window.PROFILER.overlay = not Window.PROFILER.overlay
+        return
+
+    def _draw_profiler(self):
+        """
+        Draws the profiler overlay in the top left corner.
+        Returns its rectangle and copy of what was under it.
+        Text changes every frame, so it is not kept in the text cache.
+        :return: tuple :: (<class Rect>, <class Surface>)
+        """
+        font = Window.TEXT_CACHE.font(Constants.FONT_NAME_1, Constants.PROFILER_FONT_SIZE)
+        surfs = [font.render(line, True, Constants.WHITE, Constants.BLACK) for line in Window.PROFILER.lines()]
+        rect = pygame.Rect(0, 0, max(surf.get_width() for surf in surfs) + 2 * Constants.BOX_MARGIN,
+                           sum(surf.get_height() for surf in surfs) + 2 * Constants.BOX_MARGIN)
+        rect = rect.clip(self.DISPLAYSURF.get_rect())
+        under = self.DISPLAYSURF.subsurface(rect).copy()
+        self.DISPLAYSURF.fill(Constants.BLACK, rect)
+        y = Constants.BOX_MARGIN
+        for surf in surfs:
+            self.DISPLAYSURF.blit(surf, (Constants.BOX_MARGIN, y))
+            y += surf.get_height()
+        self._mark_dirty(rect)
+        return rect, under
+
     def clear(self):
         """
         Clears the display surface.
         :return: None
         """
+        Window.PROFILER.begin("clear")
+        self._invalidate()
         self.DISPLAYSURF.fill(Constants.BGCOLOR)
+        Window.PROFILER.end("clear")
+        return
+
+    def _invalidate(self):
+        """
+        Something else is drawn over the game screen,
+        so it has to be drawn whole again, and the whole
+        screen has to be updated.
+        :return: None
+        """
+        self._scene = None
+        self._dirty = None
         return
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: bitboard
+
+from packages.public.constants import Constants
+
+
+class Bitboard(object):
+    """
+    Grid as an integer, one bit for each cell.
+    Cell (i, j) is bit i * Constants.GRID_SIZE + j.
+    Used by both server and player, so a fleet
+    can be sent as a few hex numbers.
+    """
+    SIZE = Constants.GRID_SIZE
+    CELLS = SIZE * SIZE
+    FULL = (1 << CELLS) - 1
+
+    @staticmethod
+    def bit(i, j):
+        """
+        Returns the mask of cell (i, j).
+        :param i: int
+        :param j: int
+        :return: int
+        """
+        return 1 << (i * Bitboard.SIZE + j)
+
+    @staticmethod
+    def mask(cells):
+        """
+        Returns the mask of all cells.
+        :param cells: list :: [(int, int)]
+        :return: int
+        """
+        mask = 0
+        for i, j in cells:
+            mask |= 1 << (i * Bitboard.SIZE + j)
+        return mask
+
+    @staticmethod
+    def cells(mask):
+        """
+        Returns the list of cells (i, j) in the mask.
+        :param mask: int
+        :return: list
+        """
+        cells = []
+        while mask:
+            low = mask & -mask
+            index = low.bit_length() - 1
+            cells.append(divmod(index, Bitboard.SIZE))
+            mask ^= low
+        return cells
+
+    @staticmethod
+    def count(mask):
+        """
+        Returns the number of cells in the mask.
+        :param mask: int
+        :return: int
+        """
+        return bin(mask).count('1')
+
+    @staticmethod
+    def encode(masks):
+        """
+        Returns masks as text, hex numbers separated by '|'.
+        :param masks: list
+        :return: str
+        """
+        return '|'.join(f"{mask:x}" for mask in masks)
+
+    @staticmethod
+    def decode(text):
+        """
+        Returns the list of masks from the text.
+        Raises ValueError if text is not valid.
+        :param text: str
+        :return: list
+        """
+        masks = [int(part, 16) for part in text.split('|')]
+        if any(mask <= 0 or mask > Bitboard.FULL for mask in masks):
+            raise ValueError(f"Invalid masks: {text}")
+        return masks
+
+    @staticmethod
+    def _placements():
+        """
+        Returns dictionary {mask: size} of every straight boat
+        that fits the grid, for each boat size.
+        :return: dict
+        """
+        placements = {}
+        for size in set(Constants.BOAT_SIZES):
+            for i in range(Bitboard.SIZE):
+                for j in range(Bitboard.SIZE):
+                    if j + size <= Bitboard.SIZE:
+                        placements[Bitboard.mask((i, j + k) for k in range(size))] = size
+                    if i + size <= Bitboard.SIZE:
+                        placements[Bitboard.mask((i + k, j) for k in range(size))] = size
+        return placements
+
+
+Bitboard.PLACEMENTS = Bitboard._placements()    # computed once, fleet validation is a dictionary lookup
+Bitboard.BY_SIZE = {size: tuple(mask for mask, size_ in Bitboard.PLACEMENTS.items() if size_ == size)
+                    for size in set(Constants.BOAT_SIZES)}
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: codec
+
+import struct
+import threading
+from packages.public.constants import Constants
+
+
+class Codec(object):
+    TEXT = 0    # "-strike;3|7", always supported (fallback)
+    BINARY = 1  # opcode byte + struct packed fields
+    VERSIONS = (TEXT, BINARY)
+
+    _coding = "UTF-8"
+    _text_marker = ord('-')     # every text message starts with command key, e.g. "-strike"
+
+    # binary opcodes, all of them are lower than text marker
+    _GAME = 1
+    _READY = 2
+    _STRIKE = 3
+    _STRIKE_AT = 4
+    _STRIKE_RESULT = 5
+    _STRIKE_ALL = 6
+    _DEFEND = 7
+    _LEFT = 8
+    _STAY = 9
+    _TEXT = 10  # any other message, stored as text
+
+    _coords = struct.Struct(">BHH")     # opcode, i, j
+    _result = struct.Struct(">Bb")      # opcode, box type
+    _field = struct.Struct(">BH")       # opcode, length of the text field that follows (username, fleet)
+    _field_opcodes = {Constants.CMD_GAME: _GAME, Constants.CMD_READY: _READY}
+    _field_keys = {_GAME: Constants.CMD_GAME, _READY: Constants.CMD_READY}
+
+    # Game traffic is a small set of messages repeated over and over, so their binary frames are looked up
+    # instead of packed. Messages without parameters are a single opcode byte, and frames of the strikes at each
+    # cell and of each strike result are computed once, see _precompute. Usernames are cached as they come.
+    # Caches are shared by all connections, so they are filled under the lock (threaded server), while lookups
+    # need no lock.
+    _cache_size = 4096
+    _cache_lock = threading.Lock()
+    _encoded = {
+        f"{Constants.CMD_READY};": bytes((_READY, )),
+        f"{Constants.CMD_STRIKE};": bytes((_STRIKE, )),
+        f"{Constants.CMD_STRIKE};all": bytes((_STRIKE_ALL, )),
+        f"{Constants.CMD_DEFEND};": bytes((_DEFEND, )),
+        f"{Constants.CMD_LEFT};": bytes((_LEFT, )),
+        f"{Constants.CMD_STAY};": bytes((_STAY, )),
+    }
+    _decoded = {
+        bytes((_READY, )): (Constants.CMD_READY, ""),
+        bytes((_STRIKE, )): (Constants.CMD_STRIKE, ""),
+        bytes((_STRIKE_ALL, )): (Constants.CMD_STRIKE, "all"),
+        bytes((_DEFEND, )): (Constants.CMD_DEFEND, ""),
+        bytes((_LEFT, )): (Constants.CMD_LEFT, ""),
+        bytes((_STAY, )): (Constants.CMD_STAY, ""),
+    }
+
+    @staticmethod
+    def _precompute():
+        """
+        Adds frames of the strikes at each cell of the grid,
+        and of each strike result, to the caches.
+        :return: None
+        """
+        messages = [f"{Constants.CMD_STRIKE};{i}|{j}" for i in range(Constants.GRID_SIZE)
+                    for j in range(Constants.GRID_SIZE)]
+        messages += [f"{Constants.CMD_STRIKE};{type_}" for type_ in range(Constants.EMPTY, len(Constants.BOAT_SIZES))]
+        for message in messages:
+            encoded = Codec._pack_strike(message.partition(";")[2])
+            Codec._encoded[message] = encoded
+            Codec._decoded[encoded] = tuple(message.split(";"))
+        return
+
+    @staticmethod
+    def _pack_strike(value):
+        """
+        Packs the value of "-strike;" message, either "i|j" or the result.
+        Raises ValueError or struct.error if it is neither.
+        :param value: str
+        :return: bytes
+        """
+        if '|' in value:
+            i, j = value.split('|')
+            return Codec._coords.pack(Codec._STRIKE_AT, int(i), int(j))
+        return Codec._result.pack(Codec._STRIKE_RESULT, int(value))
+
+    @staticmethod
+    def _remember(cache, key, value):
+        """
+        Adds the message to the cache, unless it is full.
+        :param cache: dict
+        :param key: str or bytes
+        :param value: bytes or tuple
+        :return: None
+        """
+        with Codec._cache_lock:
+            if len(cache) < Codec._cache_size:
+                cache[key] = value
+        return
+
+    @staticmethod
+    def encode(message, version=TEXT):
+        """
+        Encodes the message with given codec version.
+        Messages that binary codec doesn't know are sent as text.
+        :param message: str
+        :param version: int
+        :return: bytes
+        """
+        if version == Codec.TEXT:
+            return message.encode(Codec._coding)
+
+        encoded = Codec._encoded.get(message)
+        if encoded is not None:
+            return encoded
+        cmd_key, _, value = message.partition(";")
+        opcode = Codec._field_opcodes.get(cmd_key)
+        if opcode is not None:
+            field = value.encode(Codec._coding)
+            if len(field) <= 0xFFFF:
+                encoded = Codec._field.pack(opcode, len(field)) + field
+                if opcode == Codec._GAME:  # fleet is new in each game
+                    Codec._remember(cache=Codec._encoded, key=message, value=encoded)
+                return encoded
+        try:
+            if cmd_key == Constants.CMD_STRIKE:     # outside the grid, precomputed frames cover the rest
+                return Codec._pack_strike(value)
+        except (ValueError, struct.error):
+            pass
+        return bytes((Codec._TEXT, )) + message.encode(Codec._coding)
+
+    @staticmethod
+    def decode(payload):
+        """
+        Decodes the message, encoded with any of the codec versions.
+        Returns command key and value, same as the text protocol.
+        Raises ValueError if the payload is not a valid message.
+        :param payload: bytes
+        :return: tuple :: (str, str)
+        """
+        if not payload:     # frames can be empty
+            raise ValueError("Empty message.")
+        opcode = payload[0]
+        if opcode == Codec._text_marker:
+            return tuple(payload.decode(Codec._coding).split(";"))
+
+        decoded = Codec._decoded.get(payload)
+        if decoded is not None:
+            return decoded
+        cmd_key = Codec._field_keys.get(opcode)
+        if cmd_key is not None:
+            if len(payload) < Codec._field.size or \
+                    len(payload) != Codec._field.size + Codec._field.unpack_from(payload)[1]:
+                raise ValueError("Invalid message: wrong field length")
+            decoded = cmd_key, payload[Codec._field.size:].decode(Codec._coding)
+            if opcode == Codec._GAME:
+                Codec._remember(cache=Codec._decoded, key=payload, value=decoded)
+            return decoded
+        try:    # outside the grid, precomputed frames cover the rest
+            if opcode == Codec._STRIKE_AT:
+                _, i, j = Codec._coords.unpack(payload)
+                return Constants.CMD_STRIKE, f"{i}|{j}"
+            elif opcode == Codec._STRIKE_RESULT:
+                return Constants.CMD_STRIKE, str(Codec._result.unpack(payload)[1])
+        except struct.error as exception:   # wrong length
+            raise ValueError(f"Invalid message: {exception}")
+        if opcode == Codec._TEXT:
+            return tuple(payload[1:].decode(Codec._coding).split(";"))
+        raise ValueError(f"Unknown opcode: {opcode}")
+
+
+Codec._precompute()
@@ -2,18 +2,23 @@
 # -*- coding: utf-8 -*-
 # package name: communication
 
-import time
 import socket
+import threading
+import weakref
+from packages.public.codec import Codec
+from packages.public.constants import Constants
+from packages.public.framing import Framing
 from packages.public.logger import Logger
 
 
 class Communication(socket.socket):
     _coding = "UTF-8"
     _buffer = 1024  # TODO: can be reduced! chech this later! optimize!
-    _send_sleep = 0.1
-    _recv_sleep = 0.0001
     _port = 10000
-    _listen = 5
+    _listen = 1024
+    _framings = weakref.WeakKeyDictionary()    # connection: <class Framing>
+    _framings_lock = threading.Lock()
+    _codecs = weakref.WeakKeyDictionary()  # connection: codec version used for sending
 
     def __init__(self, ip_address=None):
         """
@@ -41,6 +46,7 @@ class Communication(socket.socket):
             port = Communication._port
         try:
             self.connect((ip_address, port))
+            self.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # small messages are sent immediately
             return True
         except Exception as e:
             Logger.print(message=f"[Error 43]\t\tUnable to connect to the server.\n{e}")
@@ -56,6 +62,7 @@ class Communication(socket.socket):
         :return: bool
         """
         try:
+            self.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)    # restarting the server
             self.bind((self._ip_address, Communication._port))
             self.listen(Communication._listen)
         except Exception as e:
@@ -71,7 +78,29 @@ class Communication(socket.socket):
         Waits for new clients.
         :return: <class socket>
         """
-        return self.accept()
+        connection, address = self.accept()
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # small messages are sent immediately
+        Communication.keepalive(connection=connection)
+        return connection, address
+
+    @staticmethod
+    def keepalive(connection):
+        """
+        Turns on TCP keepalive, so the client that vanishes without
+        closing the connection (network is down, computer is turned off)
+        is detected too: receiving fails after Constants.KEEPALIVE_IDLE
+        + Constants.KEEPALIVE_INTERVAL * Constants.KEEPALIVE_COUNT seconds.
+        Options that the system does not have are left out.
+        :param connection: <class socket>
+        :return: None
+        """
+        connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for option, value in (("TCP_KEEPIDLE", Constants.KEEPALIVE_IDLE),
+                              ("TCP_KEEPINTVL", Constants.KEEPALIVE_INTERVAL),
+                              ("TCP_KEEPCNT", Constants.KEEPALIVE_COUNT)):
+            if hasattr(socket, option):
+                connection.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        return
 
     @staticmethod
     @Logger.sending_info
@@ -83,8 +112,8 @@ class Communication(socket.socket):
         :return: bool
         """
         try:
-            connection.send(message.encode(Communication._coding))
-            time.sleep(Communication._send_sleep)
+            version = Communication._codecs.get(connection, Codec.TEXT)
+            connection.sendall(Framing.encode(Codec.encode(message, version)))
         except RuntimeError as exception:
             Logger.print(message=f"[Error 37]\t\tFailed to send the message. {exception}")
             return False
@@ -94,6 +123,19 @@ class Communication(socket.socket):
         else:
             return True
 
+    @staticmethod
+    def set_codec(connection, version):
+        """
+        Sets the codec version that will be used
+        for sending messages through the connection.
+        Received messages are always decoded, no matter the version.
+        :param connection: <class socket>
+        :param version: int
+        :return: None
+        """
+        Communication._codecs[connection] = version
+        return
+
     @staticmethod
     def send_to_all(sequence, message):
         """
@@ -114,23 +156,50 @@ class Communication(socket.socket):
         for example, if client sends his username, server wants to read it.
         Then, command key is "-username". If he succeedes to read it,
         returns value, otherwise "" (False).
+        Returns None if connection is closed or broken, or if the message
+        is not valid, Logger.receive_info turns it into (None, None).
         :param connection: <class socket>
         :param command_key: string (default is None)
         :return: str or list :: [str, str]
         """
-        try:
-            message = connection.recv(Communication._buffer).decode(Communication._coding)
-        except ConnectionAbortedError:
-            Logger.print(message="Connection is closed.", type_=Logger.INFO)
+        message = Communication._receive_frame(connection=connection)
+        if message is None:
             return
-        except Exception as exception:
-            Logger.print(message=f"[Error 79]\t{exception}\nFailed to receive a message.")
+        try:
+            cmd_key, value = Codec.decode(message)
+        except ValueError as exception:     # other side is broken, same as closed connection
+            Logger.print(message=f"[Warning 122]\t\tInvalid message {message!r}: {exception}")
             return
+        if command_key is None:
+            return cmd_key, value
         else:
-            if command_key is None:
-                return message.split(";")
-            else:
-                cmd_key, value = message.split(";")
-                if cmd_key == command_key:
-                    return value
-                return ""
+            if cmd_key == command_key:
+                return value
+            return ""
+
+    @staticmethod
+    def _receive_frame(connection):
+        """
+        Returns the next whole message received from the connection.
+        Reads from the connection until at least one message is complete.
+        Returns None if connection is closed.
+        :param connection: <class socket>
+        :return: bytes or None
+        """
+        framing = Communication._framings.get(connection)
+        if framing is None:
+            with Communication._framings_lock:
+                framing = Communication._framings.setdefault(connection, Framing())
+        while len(framing) == 0:
+            try:
+                data = connection.recv(Communication._buffer)
+            except ConnectionAbortedError:
+                Logger.print(message="Connection is closed.", type_=Logger.INFO)
+                return
+            except Exception as exception:
+                Logger.print(message=f"[Error 79]\t{exception}\nFailed to receive a message.")
+                return
+            if not data:    # connection is closed by the other side
+                return
+            framing.feed(data)
+        return framing.get()
@@ -2,8 +2,6 @@
 # -*- coding: utf-8 -*-
 # package name: constants
 
-import pygame
-
 
 class Constants:
     # Commands
@@ -13,17 +11,29 @@ class Constants:
     CMD_LEFT = "-left"
     CMD_STAY = "-stay"
     CMD_DEFEND = "-defend"
-    COMMAND_TIME_OFFSET = 1e-3
+    CMD_CODEC = "-codec"
+    CODEC_VERSION = 1   # preferred codec version, 0 for text only
     USERNAME_WAITING_TIME = 10  # seconds
 
-    # Game
-    GAME_LOOP_TIME_OFFSET = 1e-9
-
     # Battleship
     # SERVER_HOSTNAME = "Karlito"
     # SERVER_HOSTNAME = "192.168.1.14"
     SERVER_HOSTNAME = "192.168.5.120"
 
+    # Server
+    SERVER_MODE = "threaded"    # "threaded" or "async"
+    GAMES_LIMIT = None  # number of games that can be played at once, None for no limit
+    MATCHMAKER_STATS_SIZE = 10000   # last lobby waiting times used for percentiles
+    MATCHMAKER_REPORT_INTERVAL = 100    # games
+    KEEPALIVE_IDLE = 30     # seconds without any message, then server checks if client is still there
+    KEEPALIVE_INTERVAL = 5  # seconds between checks
+    KEEPALIVE_COUNT = 3     # failed checks, then connection is broken
+
+    # Player
+    INBOX_SIZE = 1024   # messages received from the server and not yet handled
+    INBOX_FULL_SLEEP_TIME = 0.001   # seconds
+    INBOX_STATS_SIZE = 1000     # last inbox depths and message ages used for percentiles
+
     # Window
     GAME_CAPTION = "Battleship"
     WIN_WIDTH = 1080  # px
@@ -50,9 +60,15 @@ class Constants:
     FONT_SIZE_3 = 24
     FONT_SIZE_4 = 18
     FPS = 30
-    FPS_CLOCK = pygame.time.Clock()
+    INPUT_FPS = 120     # input starts the next frame earlier, but frames are not drawn more often than this
+    TEXT_CACHE_BYTES = 4 * 1024 * 1024  # memory cap for rendered text surfaces
+    IDLE_AFTER = 0.5    # seconds without any change on the screen, after that window waits for events
+    IDLE_TIMEOUT = 0.25     # seconds, the longest wait for events when idle
+    PROFILER_SIZE = 300     # last frames used for profiler percentiles
+    PROFILER_FONT_SIZE = 14
     WELCOME_SCREEN_SLEEP_TIME = 2  # seconds
     CONNECTION_FAILED_SLEEP_TIME = 2  # seconds
+    GAME_OVER_SLEEP_TIME = 5  # seconds, game over cover is shown on top of the game screen
 
     # Grid
     SEPARATOR_WIDTH = 2  # px
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: framing
+
+import struct
+import collections
+
+
+class Framing(object):
+    HEADER = struct.Struct(">H")    # message length, 2 bytes, big endian
+    HEADER_SIZE = HEADER.size
+    MAX_SIZE = 2 ** (8 * HEADER_SIZE) - 1
+
+    def __init__(self):
+        """
+        Constructor.
+        Each message on the wire is prefixed with its length.
+        Framing object is an incremental parser for one connection:
+        it collects received bytes, no matter how they were split
+        or merged by the network, and returns whole messages.
+        """
+        self._buffer = bytearray()
+        self._frames = collections.deque()
+
+    def __len__(self):
+        """
+        Returns the number of complete, unread messages.
+        :return: int
+        """
+        return len(self._frames)
+
+    @staticmethod
+    def encode(payload):
+        """
+        Returns the payload prefixed with its length.
+        :param payload: bytes
+        :return: bytes
+        """
+        if len(payload) > Framing.MAX_SIZE:
+            raise ValueError(f"Message is too long ({len(payload)} bytes).")
+        return Framing.HEADER.pack(len(payload)) + payload
+
+    @staticmethod
+    def length(header):
+        """
+        Returns the message length stored in the header.
+        :param header: bytes
+        :return: int
+        """
+        return Framing.HEADER.unpack(header)[0]
+
+    def feed(self, data):
+        """
+        Adds received bytes to the buffer.
+        Returns the number of complete, unread messages.
+        :param data: bytes
+        :return: int
+        """
+        self._buffer += data
+        start = 0
+        end = len(self._buffer)
+        while end - start >= Framing.HEADER_SIZE:
+            size = Framing.HEADER.unpack_from(self._buffer, start)[0]
+            if end - start - Framing.HEADER_SIZE < size:    # message is not complete yet
+                break
+            start += Framing.HEADER_SIZE
+            self._frames.append(bytes(self._buffer[start:start + size]))
+            start += size
+        del self._buffer[:start]
+        return len(self._frames)
+
+    def get(self):
+        """
+        Returns the first unread message,
+        or None if there is no complete message.
+        :return: bytes or None
+        """
+        if self._frames:
+            return self._frames.popleft()
+        return None
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: limits
+
+import resource
+
+
+class Limits(object):
+
+    @staticmethod
+    def raise_open_files():
+        """
+        Raises the soft limit of open files to the hard limit,
+        so the process (and processes it starts) can hold
+        thousands of sockets.
+        :return: None
+        """
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft < hard:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        return
@@ -52,15 +52,12 @@ class Logger(object):
                         Logger.print(message=f"[Received]\t\t\tMessage: {cmd_key};{value}")
                 return value
             else:
-                try:
-                    cmd_key, value = func(*args, **kwargs)
-                except TypeError as e:
-                    # this happens when client disconnects, then socket method "recv" returns None,
-                    # which cannot be unpacked
+                message = func(*args, **kwargs)
+                if message is None:     # connection is closed or broken, see Communication.receive
                     return None, None
-                else:
-                    Logger.print(message=f"[Received]\t\tMessage: {cmd_key};{value}")
-                    return cmd_key, value
+                cmd_key, value = message
+                Logger.print(message=f"[Received]\t\tMessage: {cmd_key};{value}")
+                return cmd_key, value
 
         return receive_info_wrapper
 
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: stats
+
+import collections
+
+
+class Stats(object):
+
+    def __init__(self, size=None):
+        """
+        Constructor.
+        Keeps the last size samples (all of them if size is None)
+        and computes percentiles over them.
+        :param size: int or None
+        """
+        self._samples = collections.deque(maxlen=size)
+        self._count = 0
+
+    def __len__(self):
+        """
+        Returns the number of kept samples.
+        :return: int
+        """
+        return len(self._samples)
+
+    def __str__(self):
+        """
+        To string method.
+        :return: str
+        """
+        return ", ".join(f"p{p}: {value:.3f}" for p, value in self.percentiles().items())
+
+    @property
+    def count(self):
+        """
+        Getter. Returns the number of all added samples.
+        :return: int
+        """
+        return self._count
+
+    def add(self, value):
+        """
+        Adds the sample.
+        :param value: float
+        :return: None
+        """
+        self._samples.append(value)
+        self._count += 1
+        return
+
+    def mean(self):
+        """
+        Returns the mean of kept samples, or 0 if there are none.
+        :return: float
+        """
+        samples = list(self._samples)
+        if not samples:
+            return 0
+        return sum(samples) / len(samples)
+
+    def percentiles(self, ps=(50, 90, 99)):
+        """
+        Returns dictionary with p-th percentile of kept samples,
+        for each p in ps. Values are 0 if there are no samples.
+        :param ps: tuple
+        :return: dict
+        """
+        samples = sorted(self._samples)
+        if not samples:
+            return {p: 0 for p in ps}
+        return {p: samples[min(int(len(samples) * p / 100), len(samples) - 1)] for p in ps}
+
+    def percentile(self, p):
+        """
+        Returns p-th percentile of kept samples.
+        :param p: float
+        :return: float
+        """
+        return self.percentiles(ps=(p, ))[p]
@@ -2,77 +2,45 @@
 # -*- coding: utf-8 -*-
 # package name: clients
 
-from packages.structures.queue import Queue
+import itertools
+import threading
 
 
-class Clients(Queue):
+class Clients(dict):
 
     def __init__(self):
         """
         Constructor.
+        Registry of connected clients, indexed by session id.
+        Who is waiting for an opponent is kept by the matchmaker's lobby.
         """
         super().__init__()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()   # clients are added and removed from different threads
 
     def __str__(self):
         """
         To string.
         :return: str
         """
-        return super().__str__()
+        return f"Clients({len(self)})"
 
     def add_client(self, client):
         """
-        Adds client to queue.
+        Adds client to the registry and gives him a session id.
         :param client: <class Client>
         :return: bool
         """
-        self.enqueue(value=client)
-        return True
-
-    def remove_all(self):
-        """
-        Removes all clients.
-        :return: bool
-        """
-        while not self == []:
-            self.remove_client(client=self.dequeue())
+        with self._lock:
+            client.session_id = next(self._ids)
+            self[client.session_id] = client
         return True
 
     def remove_client(self, client):
         """
-        Removes specific client from queue.
+        Removes specific client from the registry.
         :param client: <class Client>
         :return: bool
         """
-        if client in self:
-            self.remove(client)
-            return True
-        return False
-
-    def _in_check(self, reverse):
-        """
-        Parameter reverse simply means what we want to check.
-        If set to False, we check clients that are in game.
-        Otherwise, we check clients that are in lobby.
-        :param reverse: bool
-        :return: <class Queue>
-        """
-        ret = Queue()
-        for client in self:
-            if not client.in_game == reverse:
-                ret.enqueue(value=client)
-        return ret
-
-    def in_game(self):
-        """
-        Returns queue of clients that are currently in game.
-        :return: <class Queue>
-        """
-        return self._in_check(reverse=False)
-
-    def in_lobby(self):
-        """
-        Returns queue of clients that are currently in lobby.
-        :return: <class Queue>
-        """
-        return self._in_check(reverse=True)
+        with self._lock:
+            return self.pop(client.session_id, None) is not None
@@ -20,13 +20,32 @@ class Client(object):
         self._in_lobby = True
         self._game = None
         self._ready = False
+        self._session_id = None
 
     def __str__(self):
         """
         To string method.
         :return: str
         """
-        return f"Client({self._username}, {self._connection})"
+        return f"Client({self._session_id}, {self._username}, {self._connection})"
+
+    @property
+    def session_id(self):
+        """
+        Getter. Returns the session id, given by the clients registry.
+        :return: int
+        """
+        return self._session_id
+
+    @session_id.setter
+    def session_id(self, value):
+        """
+        Setter.
+        :param value: int
+        :return: None
+        """
+        self._session_id = value
+        return
 
     @property
     def connected(self):
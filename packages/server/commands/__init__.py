@@ -2,27 +2,12 @@
 # -*- coding: utf-8 -*-
 # package name: command
 
-import functools
+from packages.public.codec import Codec
 from packages.public.constants import Constants
 from packages.public.logger import Logger
 from packages.public.timer import Timer
 from packages.server.clients.client import Client
-
-
-def _time_offset(func):
-    """
-    Decorator. Sleeps before each command to ensure right communication.
-    # TODO: Is this the best solution?
-    :param func: function
-    :return: function
-    """
-    functools.wraps(func)
-
-    def time_offset_wrapper(*args, **kwargs):
-        Timer.wait(t=Constants.COMMAND_TIME_OFFSET)
-        return func(*args, **kwargs)
-
-    return time_offset_wrapper
+from packages.server.fleet import Fleet
 
 
 class Commands(object):
@@ -34,48 +19,86 @@ class Commands(object):
         """
         self._server = server
 
-    @_time_offset
     def left(self, client):
         """
-        This command is called when one of the clients exits
-        during the game.
-        Disconnects client, kills the game (if he was in the game),
-        removes client from clients queue, informs opponent about
-        action.
+        This command is called when client leaves the server,
+        with "-left;" or when his connection is closed or broken.
+        Disconnects client, removes him from the lobby and clients
+        registry. If he was in the game, informs opponent about
+        action and ends the game, so opponent goes back to the lobby.
+        Calling it again for the same client does nothing, so it can
+        be called from the client's trace and from the matchmaker.
         :param client: <class Client>
         :return: bool
         """
         client.connected = False  # ends 'client trace' while loop in server.py
-        if client.in_game:
-            self._server.send_(connection=client.game.get_opponent(client=client).connection,
-                               message=f"{Constants.CMD_LEFT};")
-            client.game.end()
-        self._server.clients.remove_client(client=client)
+        if not self._server.matchmaker.leave(client=client):    # game is being created, matchmaker calls this again
+            return True
+        if not self._server.clients.remove_client(client=client):   # already left, maybe on the other thread
+            return True
+        game_ = client.game
+        if game_ is not None:
+            opponent = game_.get_opponent(client=client)
+            if opponent.connected and opponent.game is game_:
+                self._server.send_(connection=opponent.connection, message=f"{Constants.CMD_LEFT};")
+            self._server.end_game(game_=game_)
         return True
 
-    @staticmethod
-    def ready(client):
+    def codec(self, client, version):
         """
-        Checks if both clients are now ready.
-        Returns True if they are.
-        Server will then send command 'start' to them.
+        Client asks for the codec version that he prefers.
+        Server answers with the newest version that both of them support,
+        and from then on sends messages to the client with that codec.
         :param client: <class Client>
+        :param version: str
+        :return: None
+        """
+        try:
+            version = int(version)
+        except ValueError:
+            version = Codec.TEXT
+        version = max([v for v in Codec.VERSIONS if v <= version], default=Codec.TEXT)
+        self._server.send_(connection=client.connection, message=f"{Constants.CMD_CODEC};{version}")
+        self._server.set_codec(connection=client.connection, version=version)
+        return
+
+    def ready(self, client, value):
+        """
+        Client has drawn his fleet and sends it
+        as "fleet|<hex mask of each boat>".
+        When both clients are ready, game starts.
+        Client that sends anything else is broken (or cheating),
+        so he is disconnected and his opponent wins, otherwise
+        the game would wait for his fleet forever.
+        Returns True if game has started.
+        :param client: <class Client>
+        :param value: str
         :return: bool
         """
+        if client.game is None:
+            return False
+        kind, _, masks = value.partition('|')
+        if kind != "fleet":
+            Logger.print(message=f"[Warning 120]\t\tUnexpected ready from {client}")
+            self.left(client=client)
+            return False
+        fleet = Fleet.decode(masks)
+        if fleet is None:
+            Logger.print(message=f"[Warning 121]\t\tInvalid fleet from {client}")
+            self.left(client=client)
+            return False
         client.ready = True
-        return client.game.get_opponent(client=client).ready
+        return client.game.ready(client=client, fleet=fleet)
 
     def stay(self, client):
         """
-        If client wants to stay, server moves him to the back of the queue.
+        If client wants to stay, server moves him to the back of the lobby.
         :param client: <class Client>
         :return: None
         """
-        self._server.clients.remove_client(client=client)
-        self._server.clients.add_client(client=client)
+        self._server.matchmaker.stay(client=client)
         return
 
-    @_time_offset
     def get_username(self, connection):
         """
         Waits for client to send his username.
@@ -96,7 +119,6 @@ class Commands(object):
         else:
             return Client(connection=connection, username=username)
 
-    @_time_offset
     def game(self, client):
         """
         Informs client about newly created game in which he will be.
@@ -109,20 +131,20 @@ class Commands(object):
             Logger.print(message=f"Game object: {type(client.game.get_opponent)}", type_=Logger.ERROR)
         return
 
-    @_time_offset
     def strike(self, *args, **kwargs):
         """
-        There are multiple sorts of this method.
-        Server can send message "-strike;" to client that will
-        be attacking. In that case (and all others), expected key arguments are:
+        There are two sorts of this method.
+        Server sends message "-strike;" to client that will
+        be attacking, and "-defend;" to his opponent.
+        In that case (and the other one), expected key arguments are:
             client: <class Client>
-        Then, server can receive striking block position from attacker.
+        Then, server receives striking cell from attacker.
         Expected args are (i, j), where i and j are coordinates (int type).
-        Third case is when defender sends message "-strike;[NUM]",
-        where [NUM] stands for either miss or type of boat that has been hit.
-        Expected arg is ([NUM]).
-        Also, case where length of arg will be 1 is if defender is defeated.
-        In that case, he will send "-strike;all".
+        Server resolves the strike itself: attacker receives
+        "-strike;[NUM]", where [NUM] stands for either miss or type of boat
+        that has been hit, and defender receives "-strike;i|j".
+        If defender is defeated, attacker also receives "-strike;all"
+        and the game ends, otherwise the next turn starts right away.
         :param args: tuple
         :param kwargs: dict
         :return: bool
@@ -132,30 +154,34 @@ class Commands(object):
             return False
 
         client = kwargs["client"]
-        opponent = client.game.get_opponent(client=client)
+        game_ = client.game
+        if game_ is None:
+            return False
+        opponent = game_.get_opponent(client=client)
         if len(args) == 0:  # informs client that it is now his turn for attack
             self._server.send_(connection=client.connection, message=f"{Constants.CMD_STRIKE};")  # informs attacker
-            self._server.send_(connection=client.game.get_opponent(client=client).connection,    # informs defender
-                               message=f"{Constants.CMD_DEFEND};")
-        elif len(args) == 1:
-            value = args[0]
-            if value == "all":      # client lost, opponent won
-                self._server.send_(connection=opponent.connection, message=f"{Constants.CMD_STRIKE};all")
-                self._server.games.end_game(game_=client.game)
-            elif value.strip('-').isdigit():  # informs opponent about attack
-                self._server.send_(connection=opponent.connection, message=f"{Constants.CMD_STRIKE};{value}")
-            else:
-                Logger.print(message=f"[Error 117]\t\tInvalid args: {args}")
-                return False
+            self._server.send_(connection=opponent.connection, message=f"{Constants.CMD_DEFEND};")  # informs defender
         elif len(args) == 2:
             try:
                 i, j = map(int, args)
             except ValueError as e:
                 Logger.print(message=f"[Error 104]\t\t{e}")
                 return False
-            else:   # forwards the attacker's choice to the opponent
-                self._server.send_(connection=opponent.connection, message=f"{Constants.CMD_STRIKE};{str(i)}|{str(j)}")
+            result = game_.strike(client=client, i=i, j=j)
+            if result is None:
+                Logger.print(message=f"[Warning 119]\t\tUnexpected strike from {client}")
+                if game_.attacker == client and game_.running:     # invalid cell, he can try again
+                    self._server.send_(connection=client.connection, message=f"{Constants.CMD_STRIKE};")
+                return False
+            type_, defeated = result
+            self._server.send_(connection=client.connection, message=f"{Constants.CMD_STRIKE};{type_}")
+            self._server.send_(connection=opponent.connection, message=f"{Constants.CMD_STRIKE};{i}|{j}")
+            if defeated:    # client won
+                self._server.send_(connection=client.connection, message=f"{Constants.CMD_STRIKE};all")
+                self._server.end_game(game_=game_)
+            else:
+                self.strike(client=opponent)    # next turn, opponent attacks
         else:
-            Logger.print(message=f"[Error 116]\t\tInvalid args: {args}")
+            Logger.print(message=f"[Warning 118]\t\tUnexpected strike from {client}, args: {args}")
             return False
         return True
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: fleet
+
+from packages.core.board import Board
+from packages.public.bitboard import Bitboard
+from packages.public.constants import Constants
+
+
+class Fleet(Board):
+    # boat sizes of the whole fleet, sorted, fleet must have exactly these boats
+    SIZES = sorted(size for size, quantity in zip(Constants.BOAT_SIZES, Constants.BOAT_QUANTITY)
+                   for _ in range(quantity))
+
+    def __init__(self, masks):
+        """
+        Constructor. Extends the Board class.
+        Server side state of the player's fleet.
+        Use Fleet.decode to create a validated fleet.
+        :param masks: list
+        """
+        super().__init__()
+        for mask in masks:
+            self.place_mask(mask, Constants.BOAT_SIZES.index(Bitboard.PLACEMENTS[mask]))
+
+    @staticmethod
+    def decode(text):
+        """
+        Returns the fleet sent by the player, or None if it is not valid.
+        Each boat must be a straight line inside the grid,
+        boats must not overlap, and there must be exactly the boats
+        that the player is supposed to draw.
+        :param text: str
+        :return: <class Fleet>
+        """
+        try:
+            masks = Bitboard.decode(text)
+        except ValueError:
+            return None
+        if any(mask not in Bitboard.PLACEMENTS for mask in masks):
+            return None
+        if sorted(Bitboard.PLACEMENTS[mask] for mask in masks) != Fleet.SIZES:
+            return None
+        occupancy = 0
+        for mask in masks:
+            if occupancy & mask:    # boats overlap
+                return None
+            occupancy |= mask
+        return Fleet(masks=masks)
+
+    def can_strike(self, i, j):
+        """
+        Returns if cell (i, j) is inside the grid and has not been struck yet.
+        :param i: int
+        :param j: int
+        :return: bool
+        """
+        return self.contains(i, j) and not self.is_hit(i, j)
@@ -2,25 +2,62 @@
 # -*- coding: utf-8 -*-
 # package name: games
 
+import itertools
+import threading
+from packages.public.constants import Constants
 from packages.server.games.game import Game
 
 
-class Games(list):
-    _games_at_once_limit = 2  # only 2 games can be played at once
+class Games(dict):
 
-    def __init__(self):
+    def __init__(self, limit=Constants.GAMES_LIMIT):
         """
         Constructor.
+        Registry of active games, indexed by game id.
+        Parameter limit is the number of games that can be
+        played at once, None for no limit.
+        :param limit: int or None
         """
         super().__init__()
+        self._limit = limit
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()   # games are created and ended from different client threads
+        self._created = 0
+        self._ended = 0
+
+    @property
+    def limit(self):
+        """
+        Getter. Returns the number of games that can be played at once.
+        :return: int or None
+        """
+        return self._limit
+
+    @property
+    def created(self):
+        """
+        Getter. Returns the number of created games.
+        :return: int
+        """
+        return self._created
+
+    @property
+    def ended(self):
+        """
+        Getter. Returns the number of ended games.
+        :return: int
+        """
+        return self._ended
 
     def add_game(self, game_):
         """
-        Adds game to games list.
+        Adds game to games registry.
         :param game_: <class Game>
         :return: None
         """
-        self.append(game_)
+        with self._lock:
+            self[game_.id] = game_
+            self._created += 1
         return
 
     def available(self):
@@ -29,20 +66,32 @@ class Games(list):
         Depends on number of currently active games.
         :return: bool
         """
-        return len(self) < Games._games_at_once_limit
+        return self._limit is None or len(self) < self._limit
+
+    def get_game(self, game_id):
+        """
+        Returns the game with given id, or None.
+        :param game_id: int
+        :return: <class Game>
+        """
+        return self.get(game_id)
 
     def end_game(self, game_):
         """
         Ends game.
         Returns clients to the lobby.
+        Game can be ended only once: returns False if it has already
+        ended (for example, both clients have left at the same time).
         :param game_: <class Game>
         :return: bool
         """
+        if self.remove_game(game_) is None:
+            return False
         game_.end()
         for client in game_.clients:
-            client.in_game = False
-            client.game = None
-        self.remove_game(game_)
+            if client.game is game_:
+                client.in_game = False
+                client.game = None
         return True
 
     def new_game(self, server, clients):
@@ -57,18 +106,27 @@ class Games(list):
             client1, client2 = clients
         else:
             return False
-        game_ = Game(server=server, client1=client1, client2=client2)
+        with self._lock:    # checking and taking the free place must be atomic
+            if not self.available():
+                return False
+            game_ = Game(server=server, client1=client1, client2=client2, game_id=next(self._ids))
+            self[game_.id] = game_
+            self._created += 1
         for client in game_.clients:
             client.game = game_
             client.in_game = True
             server.commands.game(client=client)
-        self.add_game(game_)
         return True
 
     def remove_game(self, game_):
         """
-        Removes game from games list.
+        Removes game from games registry.
+        Returns None if game was not in the registry.
         :param game_: <class Game>
         :return: <class Game>
         """
-        return self.pop(self.index(game_))
+        with self._lock:
+            game_ = self.pop(game_.id, None)
+            if game_ is not None:
+                self._ended += 1
+        return game_
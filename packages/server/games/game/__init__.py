@@ -3,33 +3,55 @@
 # package name: game
 
 import threading
-from packages.public.constants import Constants
-from packages.public.timer import Timer
 from packages.public.logger import Logger
 
 
-class Game(threading.Thread):
+class Game(object):
+    # game states
+    PLACEMENT = "placement"     # players are drawing their fleets
+    ATTACK = "attack"           # waiting for the attacker to strike
+    FINISHED = "finished"
 
-    def __init__(self, server, client1, client2):
+    def __init__(self, server, client1, client2, game_id=0):
         """
         Constructor.
+        Game is a state machine, advanced by the commands
+        received from its clients. It has no thread of its own,
+        so idle game does not cost anything.
+        Game keeps both fleets and resolves the strikes itself,
+        clients only show the results.
+        Messages are sent only after the lock is released,
+        so a slow client can not block his opponent's thread.
         :param server: <class Server>
         :param client1: <class Client>
         :param client2: <class Client>
+        :param game_id: int
         """
+        self._id = game_id
         self._server = server
         self._client1 = client1
         self._client2 = client2
-        super().__init__(target=self._run)
-        self._running = False
-        self._next_turn = True
+        self._state = Game.PLACEMENT
+        self._attacker = client1
+        self._fleets = {}   # client: <class Fleet>, uploaded when client is ready
+        self._lock = threading.Lock()   # commands can come from different client threads
+        self._turns = 0
+        self._strikes = 0
 
     def __str__(self):
         """
         To string method.
         :return: str
         """
-        return f"Game({self._server.__str__()}, {', '.join(map(lambda c: c.__str__(), self.clients))})"
+        return f"Game({self._id}, {', '.join(map(lambda c: c.__str__(), self.clients))})"
+
+    @property
+    def id(self):
+        """
+        Getter. Returns the game id.
+        :return: int
+        """
+        return self._id
 
     @property
     def clients(self):
@@ -39,41 +61,37 @@ class Game(threading.Thread):
         """
         return self._client1, self._client2
 
-    def end(self):
+    @property
+    def state(self):
         """
-        Ends the game loop.
-        :return: None
+        Getter. Returns the game state.
+        :return: str
         """
-        self._running = False
-        return
+        return self._state
 
-    def get_opponent(self, client):
+    @property
+    def attacker(self):
         """
-        Returns the other client.
-        :param client: <class Client>
+        Getter. Returns the client that is attacking in this turn.
         :return: <class Client>
         """
-        if client == self._client1:
-            return self._client2
-        return self._client1
+        return self._attacker
 
     @property
-    def next_turn(self):
+    def turns(self):
         """
-        Getter. Returns the next turn status.
-        :return: bool
+        Getter. Returns the number of started turns.
+        :return: int
         """
-        return self._next_turn
+        return self._turns
 
-    @next_turn.setter
-    def next_turn(self, value):
+    @property
+    def strikes(self):
         """
-        Setter.
-        :param value: bool
-        :return: None
+        Getter. Returns the number of strikes.
+        :return: int
         """
-        self._next_turn = value
-        return
+        return self._strikes
 
     @property
     def running(self):
@@ -81,22 +99,7 @@ class Game(threading.Thread):
         Property. Returns if game is running.
         :return: bool
         """
-        return self._running
-
-    def _run(self):
-        """
-        Thread. Main game loop.
-        :return: None
-        """
-        self._running = True
-        while self._running:
-            for client in self.clients:
-                self._server.commands.strike(client=client)
-                self._next_turn = False
-                while self._running and not self._next_turn:
-                    Timer.wait(t=Constants.GAME_LOOP_TIME_OFFSET)
-        Logger.print(f"Game {self.__str__()} has finished!")
-        return
+        return self._state not in (Game.PLACEMENT, Game.FINISHED)
 
     @property
     def server(self):
@@ -105,3 +108,82 @@ class Game(threading.Thread):
         :return: <class Server>
         """
         return self._server
+
+    def end(self):
+        """
+        Ends the game.
+        :return: None
+        """
+        with self._lock:
+            if self._state != Game.FINISHED:
+                self._state = Game.FINISHED
+                Logger.print(f"Game {self.__str__()} has finished!")
+        return
+
+    def get_opponent(self, client):
+        """
+        Returns the other client.
+        :param client: <class Client>
+        :return: <class Client>
+        """
+        if client == self._client1:
+            return self._client2
+        return self._client1
+
+    def fleet(self, client):
+        """
+        Returns the client's fleet, or None if he has not sent it yet.
+        :param client: <class Client>
+        :return: <class Fleet>
+        """
+        return self._fleets.get(client)
+
+    def ready(self, client, fleet):
+        """
+        Client is ready for the game start, his fleet is drawn.
+        When both clients are ready, first turn starts.
+        Returns True if game has started.
+        :param client: <class Client>
+        :param fleet: <class Fleet>
+        :return: bool
+        """
+        with self._lock:
+            if self._state != Game.PLACEMENT or client in self._fleets:
+                return False
+            self._fleets[client] = fleet
+            if len(self._fleets) < 2:
+                return False
+            self._state = Game.ATTACK
+            self._turns += 1
+            attacker = self._attacker
+        self._server.commands.strike(client=attacker)     # informs both attacker and defender
+        return True
+
+    def strike(self, client, i, j):
+        """
+        Attacker strikes at (i, j) of the opponent's grid.
+        Returns the boat type at that cell (Constants.EMPTY for a miss)
+        and if the opponent is defeated, or None if client is not
+        allowed to strike now or at that cell.
+        If opponent is not defeated, players switch their roles for the next turn.
+        :param client: <class Client>
+        :param i: int
+        :param j: int
+        :return: tuple :: (int, bool) or None
+        """
+        with self._lock:
+            if self._state != Game.ATTACK or client != self._attacker:
+                return None
+            fleet = self._fleets[self.get_opponent(client=client)]
+            if not fleet.can_strike(i, j):
+                return None
+            self._strikes += 1
+            type_ = fleet.strike(i, j)
+            defeated = fleet.is_defeated()
+            if defeated:
+                self._state = Game.FINISHED
+                Logger.print(f"Game {self.__str__()} has finished!")
+            else:
+                self._attacker = self.get_opponent(client=client)
+                self._turns += 1
+        return type_, defeated
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: lobby
+
+import time
+import collections
+
+
+class Lobby(collections.OrderedDict):
+
+    def __init__(self):
+        """
+        Constructor.
+        FIFO of clients waiting for the game.
+        Each client is stored with the time when he entered the lobby.
+        Enqueue, dequeue and removal of any client are O(1).
+        Lobby is not thread safe, Matchmaker guards it.
+        """
+        super().__init__()
+
+    def enqueue(self, client):
+        """
+        Adds client to the back of the lobby.
+        If client is already waiting, he is moved to the back.
+        :param client: <class Client>
+        :return: None
+        """
+        self.pop(client, None)
+        self[client] = time.perf_counter()
+        return
+
+    def dequeue(self):
+        """
+        Removes the client that waits the longest.
+        Returns client and his waiting time (seconds),
+        or (None, None) if lobby is empty.
+        :return: tuple :: (<class Client>, float)
+        """
+        if len(self) == 0:
+            return None, None
+        client, since = self.popitem(last=False)
+        return client, time.perf_counter() - since
+
+    def remove_client(self, client):
+        """
+        Removes specific client from lobby.
+        :param client: <class Client>
+        :return: bool
+        """
+        return self.pop(client, None) is not None
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: matchmaker
+
+import threading
+from packages.public.constants import Constants
+from packages.public.logger import Logger
+from packages.public.stats import Stats
+from packages.server.lobby import Lobby
+
+
+class Matchmaker(threading.Thread):
+
+    def __init__(self, server):
+        """
+        Constructor.
+        Matchmaker pairs clients from the lobby as soon as two of them
+        are waiting and there is a free place for the new game.
+        It sleeps until the lobby or the games change: client connects,
+        game ends, or client sends "-stay;".
+        :param server: <class Server>
+        """
+        super().__init__(target=self._run, daemon=True)
+        self._server = server
+        self._lobby = Lobby()
+        self._pairing = set()   # clients taken from the lobby, not in the game yet
+        self._condition = threading.Condition()
+        self._running = False
+        self._paired = 0
+        self._wait_times = Stats(size=Constants.MATCHMAKER_STATS_SIZE)  # seconds spent in the lobby
+
+    @property
+    def lobby(self):
+        """
+        Getter.
+        :return: <class Lobby>
+        """
+        return self._lobby
+
+    @property
+    def wait_times(self):
+        """
+        Getter. Returns stats of lobby waiting times (seconds).
+        :return: <class Stats>
+        """
+        return self._wait_times
+
+    def start(self):
+        """
+        Starts the matchmaker thread.
+        :return: None
+        """
+        self._running = True
+        super().start()
+        return
+
+    def end(self):
+        """
+        Ends the matchmaker thread.
+        :return: None
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        return
+
+    def enqueue(self, client):
+        """
+        Adds client to the back of the lobby.
+        :param client: <class Client>
+        :return: None
+        """
+        with self._condition:
+            self._lobby.enqueue(client=client)
+            self._condition.notify()
+        return
+
+    def stay(self, client):
+        """
+        Moves client to the back of the lobby, unless he is
+        in the game or is being paired right now. Otherwise,
+        client paired at the same time would be in the lobby
+        while in the game, and would be paired twice.
+        :param client: <class Client>
+        :return: None
+        """
+        with self._condition:
+            if client.in_game or client in self._pairing:
+                return
+            self._lobby.enqueue(client=client)
+            self._condition.notify()
+        return
+
+    def leave(self, client):
+        """
+        Client has left the server, he is removed from the lobby.
+        Returns False if he is being paired right now: his game
+        is not complete yet, so matchmaker calls Commands.left
+        again when it is, and the opponent gets "-left;" after "-game;".
+        :param client: <class Client>
+        :return: bool
+        """
+        with self._condition:
+            self._lobby.remove_client(client=client)
+            return client not in self._pairing
+
+    def notify(self):
+        """
+        Wakes up the matchmaker, for example when
+        a game ends and there is a free place for the new one.
+        :return: None
+        """
+        with self._condition:
+            self._condition.notify()
+        return
+
+    def _run(self):
+        """
+        Thread. Pairs clients from the lobby.
+        :return: None
+        """
+        while True:
+            with self._condition:
+                while self._running and not (len(self._lobby) >= 2 and self._server.games.available()):
+                    self._condition.wait()
+                if not self._running:
+                    break
+                client1, waited1 = self._lobby.dequeue()
+                client2, waited2 = self._lobby.dequeue()
+                self._pairing.update((client1, client2))
+            try:
+                self._pair(client1=client1, client2=client2, waited1=waited1, waited2=waited2)
+            finally:
+                with self._condition:
+                    self._pairing.difference_update((client1, client2))
+                    left = [client for client in (client1, client2) if not client.connected]
+                for client in left:     # client has left while being paired, see leave
+                    self._server.commands.left(client=client)
+        return
+
+    def _pair(self, client1, client2, waited1, waited2):
+        """
+        Creates the game for two clients taken from the lobby.
+        If it can not be created, connected clients go back to the lobby.
+        Client that leaves meanwhile is handled by the caller.
+        :param client1: <class Client>
+        :param client2: <class Client>
+        :param waited1: float
+        :param waited2: float
+        :return: None
+        """
+        if not (client1.connected and client2.connected):   # client has left while waiting
+            for client in (client1, client2):
+                if client.connected:
+                    self.enqueue(client=client)
+            return
+        if not self._server.games.new_game(server=self._server, clients=(client1, client2)):
+            self.enqueue(client=client1)
+            self.enqueue(client=client2)
+            return
+        self._wait_times.add(waited1)
+        self._wait_times.add(waited2)
+        self._paired += 1
+        if self._paired % Constants.MATCHMAKER_REPORT_INTERVAL == 0:
+            Logger.print(message=f"Matchmaker: {self._paired} games, lobby wait (s) {self._wait_times}",
+                         type_=Logger.INFO)
+        return
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# package name: stream_connection
+
+import socket
+import asyncio
+import threading
+import collections
+from packages.public.codec import Codec
+from packages.public.communication import Communication
+from packages.public.framing import Framing
+from packages.public.logger import Logger
+
+
+class StreamConnection(object):
+
+    def __init__(self, reader, writer, loop):
+        """
+        Constructor.
+        Wraps asyncio stream pair, so it can be used as
+        client's connection in place of a socket object.
+        Communication.send_ only calls connection.sendall(), so commands
+        work with both threaded and asyncio server.
+        :param reader: <class StreamReader>
+        :param writer: <class StreamWriter>
+        :param loop: <class AbstractEventLoop>
+        """
+        self._reader = reader
+        self._writer = writer
+        self._loop = loop
+        self._loop_thread = threading.get_ident()  # connection is always created inside the event loop
+        self._closed = False
+        self._outbox = collections.deque()  # messages sent from other threads, not written yet
+        # asyncio sets this only for sockets created with IPPROTO_TCP, not for the default protocol 0
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        Communication.keepalive(connection=writer.get_extra_info("socket"))
+
+    def __str__(self):
+        """
+        To string method.
+        :return: str
+        """
+        return f"StreamConnection({self._writer.get_extra_info('peername')})"
+
+    @property
+    def closed(self):
+        """
+        Getter.
+        :return: bool
+        """
+        return self._closed
+
+    def sendall(self, data):
+        """
+        Same as socket's sendall method, but it never blocks.
+        Data is buffered by the stream writer. Method can be called
+        from any thread (for example, from the matchmaker thread),
+        messages are written in the order they were sent.
+        :param data: bytes
+        :return: None
+        """
+        if self._closed:
+            raise OSError("Connection is closed.")
+        if threading.get_ident() == self._loop_thread:
+            self._flush()   # messages sent from other threads go first
+            self._writer.write(data)
+        else:
+            self._outbox.append(data)
+            self._loop.call_soon_threadsafe(self._flush)
+        return
+
+    def _flush(self):
+        """
+        Writes the messages sent from other threads, in order,
+        from the event loop.
+        :return: None
+        """
+        while self._outbox:
+            self._writer.write(self._outbox.popleft())
+        return
+
+    async def receive(self):
+        """
+        Asyncio version of Communication.receive.
+        Returns tuple (cmd_key, value), or (None, None)
+        if client has disconnected or sent an invalid message.
+        :return: tuple :: (str, str)
+        """
+        try:
+            header = await self._reader.readexactly(Framing.HEADER_SIZE)
+            data = await self._reader.readexactly(Framing.length(header))
+        except asyncio.IncompleteReadError:    # connection is closed by the other side
+            return None, None
+        except (ConnectionError, OSError) as exception:
+            Logger.print(message=f"[Error 79]\t{exception}\nFailed to receive a message.")
+            return None, None
+        try:
+            cmd_key, value = Codec.decode(data)
+        except ValueError as exception:     # client is broken, same as disconnected
+            Logger.print(message=f"[Warning 122]\t\tInvalid message {data!r}: {exception}")
+            return None, None
+        Logger.print(message=f"[Received]\t\tMessage: {cmd_key};{value}")
+        return cmd_key, value
+
+    def close(self):
+        """
+        Closes the connection.
+        Method can be called from any thread.
+        :return: None
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if threading.get_ident() == self._loop_thread:
+            self._close()
+        else:
+            self._loop.call_soon_threadsafe(self._close)
+        return
+
+    def _close(self):
+        """
+        Closes the stream, from the event loop.
+        :return: None
+        """
+        self._writer.close()
+        return
@@ -2,14 +2,17 @@
 # -*- coding: utf-8 -*-
 # package name: queue
 
+import threading
+import collections
 from packages.structures.iterable import Iterable
 
 
-class Queue(list):
+class Queue(collections.deque):
 
     def __init__(self):
         """
         Constructor.
+        Unbounded queue, enqueue and dequeue are O(1).
         """
         super().__init__()
 
@@ -20,17 +23,32 @@ class Queue(list):
         :return: bool
         """
         self.append(value)
+        return True
 
     def dequeue(self):
         """
         Removes the first of remaining elements
         that has been added in the queue.
+        Returns None if queue is empty.
         :return: <class object>
         """
         if len(self) > 0:
-            return self.pop(0)
+            return self.popleft()
         return None
 
+    def dequeue_many(self, n=None):
+        """
+        Removes (at most) n first elements of the queue,
+        or all of them if n is None.
+        :param n: int or None
+        :return: list
+        """
+        if n is None or n >= len(self):
+            values = list(self)
+            self.clear()
+            return values
+        return [self.popleft() for _ in range(n)]
+
     def peek(self, n=1):
         """
         Returns the first n elements of the queue.
@@ -40,7 +58,352 @@ class Queue(list):
         """
         if n > len(self):
             return []
-        return self[0], self[1]
+        return [self[i] for i in range(n)]
+
+
+class RingBuffer(object):
+
+    def __init__(self, capacity):
+        """
+        Constructor.
+        Bounded queue, stored in the preallocated list.
+        Enqueue and dequeue are O(1) and never allocate.
+        :param capacity: int
+        """
+        if capacity < 1:
+            raise AttributeError("Parameter capacity must be greather than zero!")
+        self._buffer = [None] * capacity
+        self._capacity = capacity
+        self._head = 0  # index of the first element
+        self._size = 0
+
+    def __len__(self):
+        """
+        Returns the number of elements.
+        :return: int
+        """
+        return self._size
+
+    def __str__(self):
+        """
+        To string method.
+        :return: str
+        """
+        return f"RingBuffer({self.peek(n=self._size)}, capacity={self._capacity})"
+
+    @property
+    def capacity(self):
+        """
+        Getter.
+        :return: int
+        """
+        return self._capacity
+
+    def full(self):
+        """
+        Returns if the buffer is full.
+        :return: bool
+        """
+        return self._size == self._capacity
+
+    def enqueue(self, value):
+        """
+        Adds new element in queue.
+        Returns False if the buffer is full.
+        :param value: <class object>
+        :return: bool
+        """
+        if self._size == self._capacity:
+            return False
+        self._buffer[(self._head + self._size) % self._capacity] = value
+        self._size += 1
+        return True
+
+    def dequeue(self):
+        """
+        Removes the first of remaining elements
+        that has been added in the queue.
+        Returns None if queue is empty.
+        :return: <class object>
+        """
+        if self._size == 0:
+            return None
+        value = self._buffer[self._head]
+        self._buffer[self._head] = None
+        self._head = (self._head + 1) % self._capacity
+        self._size -= 1
+        return value
+
+    def dequeue_many(self, n=None):
+        """
+        Removes (at most) n first elements of the queue,
+        or all of them if n is None.
+        :param n: int or None
+        :return: list
+        """
+        if n is None or n > self._size:
+            n = self._size
+        values = self._slice(n=n)
+        end = self._head + n
+        if end <= self._capacity:
+            self._buffer[self._head:end] = [None] * n
+        else:
+            self._buffer[self._head:] = [None] * (self._capacity - self._head)
+            self._buffer[:end - self._capacity] = [None] * (end - self._capacity)
+        self._head = end % self._capacity
+        self._size -= n
+        return values
+
+    def peek(self, n=1):
+        """
+        Returns the first n elements of the queue.
+        If n > size, returns emptly list.
+        :param n: int
+        :return: list
+        """
+        if n > self._size:
+            return []
+        return self._slice(n=n)
+
+    def _slice(self, n):
+        """
+        Returns the first n elements (n <= size).
+        :param n: int
+        :return: list
+        """
+        end = self._head + n
+        if end <= self._capacity:
+            return self._buffer[self._head:end]
+        return self._buffer[self._head:] + self._buffer[:end - self._capacity]
+
+
+class SafeQueue(Queue):
+
+    def __init__(self):
+        """
+        Constructor.
+        Thread safe version of Queue.
+        Dequeue can block until some element is added.
+        """
+        super().__init__()
+        self._condition = threading.Condition()
+
+    def enqueue(self, value):
+        """
+        Adds new element in queue.
+        :param value: <class object>
+        :return: bool
+        """
+        with self._condition:
+            self.append(value)
+            self._condition.notify()
+        return True
+
+    def dequeue(self, block=False, timeout=None):
+        """
+        Removes the first element of the queue.
+        If block, waits (at most timeout seconds, if given) for it.
+        Returns None if queue is empty.
+        :param block: bool
+        :param timeout: float or None
+        :return: <class object>
+        """
+        with self._condition:
+            if block:
+                self._condition.wait_for(lambda: len(self) > 0, timeout=timeout)
+            return super().dequeue()
+
+    def dequeue_many(self, n=None, block=False, timeout=None):
+        """
+        Removes (at most) n first elements of the queue, or all of them if n is None.
+        If block, waits (at most timeout seconds, if given) for at least one.
+        :param n: int or None
+        :param block: bool
+        :param timeout: float or None
+        :return: list
+        """
+        with self._condition:
+            if block:
+                self._condition.wait_for(lambda: len(self) > 0, timeout=timeout)
+            return super().dequeue_many(n=n)
+
+    def peek(self, n=1):
+        """
+        Returns the first n elements of the queue.
+        :param n: int
+        :return: list
+        """
+        with self._condition:
+            return super().peek(n=n)
+
+
+class SafeRingBuffer(RingBuffer):
+
+    def __init__(self, capacity):
+        """
+        Constructor.
+        Thread safe version of RingBuffer.
+        Enqueue can block while buffer is full,
+        dequeue can block while buffer is empty.
+        :param capacity: int
+        """
+        super().__init__(capacity=capacity)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def enqueue(self, value, block=False, timeout=None):
+        """
+        Adds new element in queue.
+        If block, waits (at most timeout seconds, if given) for a free place.
+        Returns False if the buffer is full.
+        :param value: <class object>
+        :param block: bool
+        :param timeout: float or None
+        :return: bool
+        """
+        with self._not_full:
+            if block:
+                self._not_full.wait_for(lambda: not self.full(), timeout=timeout)
+            if not super().enqueue(value):
+                return False
+            self._not_empty.notify()
+        return True
+
+    def dequeue(self, block=False, timeout=None):
+        """
+        Removes the first element of the queue.
+        If block, waits (at most timeout seconds, if given) for it.
+        Returns None if queue is empty.
+        :param block: bool
+        :param timeout: float or None
+        :return: <class object>
+        """
+        with self._not_empty:
+            if block:
+                self._not_empty.wait_for(lambda: self._size > 0, timeout=timeout)
+            if self._size == 0:
+                return None
+            value = super().dequeue()
+            self._not_full.notify()
+        return value
+
+    def dequeue_many(self, n=None, block=False, timeout=None):
+        """
+        Removes (at most) n first elements of the queue, or all of them if n is None.
+        If block, waits (at most timeout seconds, if given) for at least one.
+        :param n: int or None
+        :param block: bool
+        :param timeout: float or None
+        :return: list
+        """
+        with self._not_empty:
+            if block:
+                self._not_empty.wait_for(lambda: self._size > 0, timeout=timeout)
+            values = super().dequeue_many(n=n)
+            if values:
+                self._not_full.notify_all()
+        return values
+
+    def peek(self, n=1):
+        """
+        Returns the first n elements of the queue.
+        :param n: int
+        :return: list
+        """
+        with self._lock:
+            return super().peek(n=n)
+
+
+class SPSCRingBuffer(object):
+
+    def __init__(self, capacity):
+        """
+        Constructor.
+        Bounded queue for exactly one producer thread
+        and exactly one consumer thread, without locks.
+        Producer only moves the tail, consumer only moves the head,
+        and each of them writes its counter after the element,
+        so the other one never sees a half-done operation.
+        :param capacity: int
+        """
+        if capacity < 1:
+            raise AttributeError("Parameter capacity must be greather than zero!")
+        self._buffer = [None] * capacity
+        self._capacity = capacity
+        self._head = 0  # number of dequeued elements, written by consumer only
+        self._tail = 0  # number of enqueued elements, written by producer only
+
+    def __len__(self):
+        """
+        Returns the number of elements.
+        Exact for the consumer, it can only grow while he reads it.
+        :return: int
+        """
+        return self._tail - self._head
+
+    def __str__(self):
+        """
+        To string method.
+        :return: str
+        """
+        return f"SPSCRingBuffer({len(self)}, capacity={self._capacity})"
+
+    @property
+    def capacity(self):
+        """
+        Getter.
+        :return: int
+        """
+        return self._capacity
+
+    def full(self):
+        """
+        Returns if the buffer is full.
+        :return: bool
+        """
+        return self._tail - self._head == self._capacity
+
+    def enqueue(self, value):
+        """
+        Adds new element in queue. Producer only.
+        Returns False if the buffer is full.
+        :param value: <class object>
+        :return: bool
+        """
+        tail = self._tail
+        if tail - self._head == self._capacity:
+            return False
+        self._buffer[tail % self._capacity] = value
+        self._tail = tail + 1   # publishes the element
+        return True
+
+    def dequeue(self):
+        """
+        Removes the first element of the queue. Consumer only.
+        Returns None if queue is empty.
+        :return: <class object>
+        """
+        head = self._head
+        if head == self._tail:
+            return None
+        index = head % self._capacity
+        value = self._buffer[index]
+        self._buffer[index] = None
+        self._head = head + 1   # frees the place
+        return value
+
+    def dequeue_many(self, n=None):
+        """
+        Removes (at most) n first elements of the queue,
+        or all of them if n is None. Consumer only.
+        :param n: int or None
+        :return: list
+        """
+        available = self._tail - self._head
+        if n is None or n > available:
+            n = available
+        return [self.dequeue() for _ in range(n)]
 
 
 class QueueC(Iterable):
@@ -128,7 +491,7 @@ class QueueC(Iterable):
         :param value: <class object>
         :return: bool
         """
-        element = Queue.QueueElement(value=value)
+        element = QueueC.QueueElement(value=value)
         # if we have queue that is empty
         if self._read is None and self._write is None:
             self._read = self._write = element
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
+import asyncio
 import threading
 
 from packages.server.clients import Clients
@@ -9,18 +11,26 @@ from packages.server.commands import Commands
 from packages.public.communication import Communication
 from packages.public.logger import Logger
 from packages.server.games import Games
+from packages.server.matchmaker import Matchmaker
 from packages.public.constants import Constants
+from packages.server.stream_connection import StreamConnection
 
 
 class Server(Communication):
+    MODE = "threaded"
 
-    def __init__(self, ip_address):
+    def __init__(self, ip_address, games_limit=Constants.GAMES_LIMIT):
         """
         Constructor.
+        Parameter games_limit is the number of games
+        that can be played at once, None for no limit.
+        :param ip_address: str
+        :param games_limit: int or None
         """
         super().__init__(ip_address=ip_address)
         self._clients = Clients()
-        self._games = Games()
+        self._games = Games(limit=games_limit)
+        self._matchmaker = Matchmaker(server=self)
         self._commands = Commands(server=self)
 
     @property
@@ -39,6 +49,14 @@ class Server(Communication):
         """
         return self._games
     
+    @property
+    def matchmaker(self):
+        """
+        Getter. Returns the matchmaker, which pairs clients from the lobby.
+        :return: <class Matchmaker>
+        """
+        return self._matchmaker
+
     @property
     def commands(self):
         """
@@ -51,17 +69,30 @@ class Server(Communication):
         """
         Main server loop.
         Waits and accepts new clients.
-        Starts new games when ready.
+        New games are started by the matchmaker.
         :return: None
         """
+        self._matchmaker.start()
         while True:
             connection, address = self.wait()
             thread = threading.Thread(target=self.trace, args=(connection, ))
             thread.start()
 
-            clients = self._clients.in_lobby().peek(n=2)
-            if clients != [] and self._games.available():
-                self._games.new_game(server=self, clients=clients)
+    def end_game(self, game_):
+        """
+        Ends the game. Clients are not put back into the lobby here:
+        each of them goes back only when he sends "-stay;", after he
+        has seen the end of the game (see Commands.stay), so a late
+        message from this game (e.g. "-ready;") can not reach the next
+        one. Until then, client is out of the game, but not in the
+        matchmaker's lobby, which is the only record of waiting clients.
+        :param game_: <class Game>
+        :return: None
+        """
+        if not self._games.end_game(game_=game_):   # already ended
+            return
+        self._matchmaker.notify()   # there is a free place for the new game
+        return
 
     def trace(self, connection):
         """
@@ -74,44 +105,123 @@ class Server(Communication):
         client = Client(connection=connection, username="")
         client.connected = True
         self._clients.add_client(client=client)
+        self._matchmaker.enqueue(client=client)
 
         # runs this loop while client is connected to the server
         while client.connected:
             cmd_key, value = self.receive(connection=connection)
-
-            if cmd_key == Constants.CMD_LEFT:
+            if cmd_key is None:     # client has disconnected without sending "-left;"
                 self._commands.left(client=client)
+                break
+            self.dispatch(client=client, cmd_key=cmd_key, value=value)
+        connection.close()
+        return
 
-            elif cmd_key == Constants.CMD_READY:
-                if Commands.ready(client=client):
-                    if value != "":
-                        # value can be "fleet" - player has drawn the fleet and is now ready for the game start
-                        client.game.start()
-                    elif value == "":
-                        client.game.next_turn = True
-
-            elif cmd_key == Constants.CMD_STAY:
-                self._commands.stay(client=client)
-
-            elif cmd_key == Constants.CMD_STRIKE:
-                if value == "":
-                    self._commands.strike(client=client)
-                elif '|' in value:
-                    self._commands.strike(*value.split('|'), client=client)
-                else:
-                    self._commands.strike(value, client=client)
+    def dispatch(self, client, cmd_key, value):
+        """
+        Calls the appropriate command for message
+        received from the client.
+        :param client: <class Client>
+        :param cmd_key: str
+        :param value: str
+        :return: None
+        """
+        if cmd_key == Constants.CMD_LEFT:
+            self._commands.left(client=client)
+
+        elif cmd_key == Constants.CMD_READY:
+            # value is "fleet|<masks>" - player has drawn the fleet and is now ready for the game start
+            self._commands.ready(client=client, value=value)
+
+        elif cmd_key == Constants.CMD_STAY:
+            self._commands.stay(client=client)
 
+        elif cmd_key == Constants.CMD_CODEC:
+            self._commands.codec(client=client, version=value)
+
+        elif cmd_key == Constants.CMD_STRIKE:
+            if '|' in value:     # attacker strikes at i|j, anything else is not expected from the client
+                self._commands.strike(*value.split('|'), client=client)
             else:
-                Logger.print(message=f"[Warning 101]\t\tInvalid command: {cmd_key} from {client}")
+                self._commands.strike(value, client=client)
+
+        else:
+            Logger.print(message=f"[Warning 101]\t\tInvalid command: {cmd_key} from {client}")
+        return
+
+
+class AsyncServer(Server):
+    MODE = "async"
+
+    def __init__(self, ip_address, games_limit=Constants.GAMES_LIMIT):
+        """
+        Constructor. Extends the Server class.
+        Instead of a thread for each client, server runs
+        a single event loop with one coroutine per connection.
+        Commands, clients and games are shared with the threaded server.
+        :param ip_address: str
+        :param games_limit: int or None
+        """
+        super().__init__(ip_address=ip_address, games_limit=games_limit)
+
+    def running(self):
+        """
+        Main server loop.
+        Runs the event loop until the server is stopped.
+        :return: None
+        """
+        self._matchmaker.start()
+        asyncio.run(self._serve())
+
+    async def _serve(self):
+        """
+        Starts serving on the already bound and listening socket.
+        :return: None
+        """
+        server = await asyncio.start_server(self.trace, sock=self, backlog=Communication._listen)
+        async with server:
+            await server.serve_forever()
+
+    async def trace(self, reader, writer):
+        """
+        Coroutine for each client. Coroutine is active while client is
+        connected to the server.
+        :param reader: <class StreamReader>
+        :param writer: <class StreamWriter>
+        :return: None
+        """
+        connection = StreamConnection(reader=reader, writer=writer, loop=asyncio.get_running_loop())
+        Logger.print(message=f"[Connected]\t\tClient {writer.get_extra_info('peername')} is connected.")
+
+        client = Client(connection=connection, username="")
+        client.connected = True
+        self._clients.add_client(client=client)
+        self._matchmaker.enqueue(client=client)
+
+        while client.connected:
+            cmd_key, value = await connection.receive()
+            if cmd_key is None:     # client has disconnected without sending "-left;"
+                self._commands.left(client=client)
+                break
+            self.dispatch(client=client, cmd_key=cmd_key, value=value)
+        connection.close()
         return
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Battleship server.")
+    parser.add_argument("ip_address", nargs="?", default=Constants.SERVER_HOSTNAME)
+    parser.add_argument("--mode", choices=(Server.MODE, AsyncServer.MODE), default=Constants.SERVER_MODE)
+    parser.add_argument("--games-limit", type=int, default=Constants.GAMES_LIMIT,
+                        help="number of games that can be played at once (default: no limit)")
+    args = parser.parse_args()
+
     # server = Server(ip_address=socket.gethostbyname(socket.gethostname()))
-    server = Server(ip_address="192.168.5.120")
     # print(socket.gethostname())
     # print(socket.gethostbyname("KarlitoHome"))   # error?
     # print(socket.gethostbyaddr("192.168.5.120"))
+    server = {Server.MODE: Server, AsyncServer.MODE: AsyncServer}[args.mode](ip_address=args.ip_address,
+                                                                             games_limit=args.games_limit)
     server.start_server(func=server.running)
 
 